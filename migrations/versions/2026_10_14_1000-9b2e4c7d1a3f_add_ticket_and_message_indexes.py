@@ -0,0 +1,37 @@
+"""add ticket and message indexes
+
+Revision ID: 9b2e4c7d1a3f
+Revises: 6a86a524354a
+Create Date: 2026-10-14 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2e4c7d1a3f'
+down_revision: Union[str, None] = '6a86a524354a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Indexes are built concurrently to avoid locking the tables for writes,
+    # which can't be done inside a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_tickets_user_id'), 'tickets', ['user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_tickets_status_id'), 'tickets', ['status_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_messages_ticket_id_created_at', 'messages', ['ticket_id', 'created_at'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_messages_ticket_id_created_at', table_name='messages', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_tickets_status_id'), table_name='tickets', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_tickets_user_id'), table_name='tickets', postgresql_concurrently=True)
@@ -0,0 +1,53 @@
+"""generate primary keys in database
+
+Revision ID: 4d8f2a6b9c1e
+Revises: 9b2e4c7d1a3f
+Create Date: 2026-10-14 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d8f2a6b9c1e'
+down_revision: Union[str, None] = '9b2e4c7d1a3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # `gen_random_uuid()` is built into PostgreSQL 13+, older versions need the pgcrypto extension.
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    op.alter_column('ticket_statuses', 'id',
+               existing_type=sa.Uuid(),
+               server_default=sa.text('gen_random_uuid()'),
+               existing_nullable=False)
+    op.alter_column('tickets', 'id',
+               existing_type=sa.Uuid(),
+               server_default=sa.text('gen_random_uuid()'),
+               existing_nullable=False)
+    op.alter_column('messages', 'id',
+               existing_type=sa.Uuid(),
+               server_default=sa.text('gen_random_uuid()'),
+               existing_nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('messages', 'id',
+               existing_type=sa.Uuid(),
+               server_default=None,
+               existing_nullable=False)
+    op.alter_column('tickets', 'id',
+               existing_type=sa.Uuid(),
+               server_default=None,
+               existing_nullable=False)
+    op.alter_column('ticket_statuses', 'id',
+               existing_type=sa.Uuid(),
+               server_default=None,
+               existing_nullable=False)
@@ -0,0 +1,34 @@
+"""add is_ai to messages index
+
+Revision ID: 7c3e9a1f5b2d
+Revises: 4d8f2a6b9c1e
+Create Date: 2026-10-14 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import fastapi_users_db_sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3e9a1f5b2d'
+down_revision: Union[str, None] = '4d8f2a6b9c1e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The new index is built before the old one is dropped, so the message queries are never left without one.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_messages_ticket_id_created_at_is_ai', 'messages', ['ticket_id', 'created_at', 'is_ai'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_messages_ticket_id_created_at', table_name='messages', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_messages_ticket_id_created_at', 'messages', ['ticket_id', 'created_at'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_messages_ticket_id_created_at_is_ai', table_name='messages', postgresql_concurrently=True)
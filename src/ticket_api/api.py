@@ -1,16 +1,28 @@
+import asyncio
+import contextlib
+from typing import AsyncIterator
+
 from fastapi import FastAPI
-from .auth.router import auth_router, register_router, users_router
+from fastapi.responses import ORJSONResponse
+from .auth.router import combined_auth_router, users_router
+from .tickets.ai import AIService
 from .tickets.router import router as tickets_router
 
-app = FastAPI()
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    app.state.ai_service = AIService()
+    # Tasks that outlive their request (e.g. saving a streamed AI message), referenced here so they are not garbage collected.
+    app.state.background_tasks = set()
+    yield
+    await asyncio.gather(*app.state.background_tasks, return_exceptions=True)
+    await app.state.ai_service.close()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.include_router(
-    auth_router,
-    prefix="/auth",
-    tags=["auth"],
-)
-app.include_router(
-    register_router,
+    combined_auth_router,
     prefix="/auth",
     tags=["auth"],
 )
@@ -9,12 +9,14 @@ from .service import UserService
 
 
 async def get_user_repository(
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_session, use_cache=True),
 ) -> AsyncGenerator[SQLAlchemyUserDatabase, None]:
     yield SQLAlchemyUserDatabase(session, User)
 
 
 async def get_user_service(
-    user_repository: SQLAlchemyUserDatabase = Depends(get_user_repository),
+    user_repository: SQLAlchemyUserDatabase = Depends(
+        get_user_repository, use_cache=True
+    ),
 ) -> AsyncGenerator[UserService, None]:
     yield UserService(user_repository)
@@ -1,5 +1,6 @@
 import uuid
 
+from fastapi import APIRouter
 from fastapi_users import FastAPIUsers
 
 from .backend import auth_backend
@@ -16,5 +17,9 @@ auth_router = fastapi_users.get_auth_router(auth_backend)
 register_router = fastapi_users.get_register_router(UserRead, UserCreate)
 users_router = fastapi_users.get_users_router(UserRead, UserUpdate)
 
+combined_auth_router = APIRouter()
+combined_auth_router.include_router(auth_router)
+combined_auth_router.include_router(register_router)
+
 get_current_active_user = fastapi_users.current_user(active=True)
 get_current_active_superuser = fastapi_users.current_user(active=True, superuser=True)
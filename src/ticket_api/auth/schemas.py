@@ -15,3 +15,8 @@ class UserUpdate(schemas.BaseUserUpdate):
 
 class UserRead(schemas.BaseUser[uuid.UUID]):
     tickets: list["TicketRead"]
+
+
+UserCreate.model_rebuild()
+UserUpdate.model_rebuild()
+UserRead.model_rebuild()
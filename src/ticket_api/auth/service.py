@@ -1,3 +1,4 @@
+import logging
 import uuid
 from typing import Optional
 
@@ -8,6 +9,30 @@ from ..config import settings
 from .models import User
 from .schemas import UserCreate
 
+logger = logging.getLogger(__name__)
+
+HAS_DIGIT = 1
+HAS_UPPER = 2
+HAS_LOWER = 4
+HAS_SPECIAL = 8
+REQUIRED = HAS_DIGIT | HAS_UPPER | HAS_LOWER | HAS_SPECIAL
+
+
+def _char_classes(char: str) -> int:
+    return (
+        char.isdigit() * HAS_DIGIT
+        | char.isupper() * HAS_UPPER
+        | char.islower() * HAS_LOWER
+        | (char in settings.PASSWORD_SPECIAL_CHARS) * HAS_SPECIAL
+    )
+
+
+# Maps every ASCII byte to the bitmask of the character classes it belongs to.
+# Only used for ASCII passwords, the upper half of the table is never looked up.
+CLASS_TABLE = bytes(
+    _char_classes(chr(code)) if code < 0x80 else 0 for code in range(256)
+)
+
 
 class UserService(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     reset_password_token_secret = settings.SECRET_KEY
@@ -16,17 +41,21 @@ class UserService(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
     async def on_after_register(
         self, user: User, request: Optional[Request] = None
     ) -> None:
-        print(f"User {user.id} has registered.")
+        logger.info("User %s has registered.", user.id)
 
     async def on_after_forgot_password(
         self, user: User, token: str, request: Optional[Request] = None
     ) -> None:
-        print(f"User {user.id} has forgotten their password. Token: {token}")
+        logger.info("User %s has forgotten their password. Token: %s", user.id, token)
 
     async def on_after_request_verify(
         self, user: User, token: str, request: Optional[Request] = None
     ):
-        print(f"Verification requested for user {user.id}. Verification token: {token}")
+        logger.info(
+            "Verification requested for user %s. Verification token: %s",
+            user.id,
+            token,
+        )
 
     async def validate_password(self, password: str, user: UserCreate | User) -> None:
         """Password validation method override.
@@ -38,25 +67,41 @@ class UserService(UUIDIDMixin, BaseUserManager[User, uuid.UUID]):
         - Contains at least one uppercase letter
         - Contains at least one lowercase letter
         - Contains at least one special character from the defined set
+
+        ASCII passwords are classified in C with `bytes.translate` over `CLASS_TABLE`,
+        any other password falls back to the Unicode-aware `str` methods.
         """
 
         if len(password) < 8:
             raise InvalidPasswordException(
                 reason="Password must be at least 8 characters long."
             )
-        if not any(char.isdigit() for char in password):
+
+        if password.isascii():
+            classes = set(password.encode("ascii").translate(CLASS_TABLE))
+        else:
+            classes = {_char_classes(char) for char in set(password)}
+
+        mask = 0
+        for char_classes in classes:
+            mask |= char_classes
+
+        if mask == REQUIRED:
+            return
+
+        if not mask & HAS_DIGIT:
             raise InvalidPasswordException(
                 reason="Password must contain at least one digit."
             )
-        if not any(char.isupper() for char in password):
+        if not mask & HAS_UPPER:
             raise InvalidPasswordException(
                 reason="Password must contain at least one uppercase letter."
             )
-        if not any(char.islower() for char in password):
+        if not mask & HAS_LOWER:
             raise InvalidPasswordException(
                 reason="Password must contain at least one lowercase letter."
             )
-        if not any(char in settings.PASSWORD_SPECIAL_CHARS for char in password):
+        if not mask & HAS_SPECIAL:
             raise InvalidPasswordException(
                 reason="Password must contain at least one special character."
             )
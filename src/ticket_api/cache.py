@@ -0,0 +1,104 @@
+import time
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """Simple in-process cache with a fixed time-to-live for every entry.
+
+    It is meant for small, rarely changing lookup data (e.g. ticket statuses) that is read on most requests.
+    The API runs as a single process, so an in-process cache avoids a network hop to an external cache server.
+    Entries are invalidated explicitly on writes, the TTL only bounds how long a missed invalidation can be visible.
+
+    Entries are kept in write order, and all of them share the same TTL,
+    so when `maxsize` is reached the oldest entry, which is also the first to expire, is evicted.
+
+    Every invalidation advances `generation`. A fill takes the generation before it reads the data and passes it to `set`,
+    which drops the value if its key was invalidated in the meantime, so a read racing a write can't cache the old data
+    after the write's invalidation.
+
+    Attributes:
+        ttl (float): Time-to-live of an entry in seconds.
+        maxsize (int | None): Maximum number of entries, unbounded if None.
+        generation (int): Incremented on every `delete` and `clear`.
+
+    """
+
+    def __init__(self, ttl: float, maxsize: int | None = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.generation = 0
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        # Generation of the last invalidation of each key, oldest first. Bounded like the entries,
+        # the generation of a dropped record is kept in `_invalidated_floor` and applies to every key.
+        self._invalidated: dict[Hashable, int] = {}
+        self._invalidated_floor = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a value from the cache.
+
+        Args:
+            key (Hashable): The key of the value to retrieve.
+            default (Any): The value to return if the key is missing or expired.
+
+        Returns:
+            Any: The cached value or `default`.
+
+        """
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        """Store a value in the cache.
+
+        Args:
+            key (Hashable): The key to store the value under.
+            value (Any): The value to store.
+            generation (int | None): The `generation` taken before the value was read,
+                the value is not stored if the key was invalidated since then.
+
+        """
+
+        if generation is not None and generation < max(
+            self._invalidated_floor, self._invalidated.get(key, 0)
+        ):
+            return
+
+        self._entries.pop(key, None)
+        if self.maxsize is not None and len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def delete(self, *keys: Hashable) -> None:
+        """Remove values from the cache, missing keys are ignored.
+
+        Args:
+            *keys (Hashable): The keys to remove.
+
+        """
+
+        self.generation += 1
+        for key in keys:
+            self._entries.pop(key, None)
+            self._invalidated.pop(key, None)
+            self._invalidated[key] = self.generation
+
+        if self.maxsize is not None:
+            while len(self._invalidated) > self.maxsize:
+                oldest = next(iter(self._invalidated))
+                self._invalidated_floor = self._invalidated.pop(oldest)
+
+    def clear(self) -> None:
+        """Remove all values from the cache."""
+
+        self.generation += 1
+        self._entries.clear()
+        self._invalidated.clear()
+        self._invalidated_floor = self.generation
@@ -3,11 +3,13 @@ from pathlib import Path
 
 from fastapi_cli.cli import dev as dev_command
 from fastapi_cli.cli import run as run_command
+from fastapi_users.db import SQLAlchemyUserDatabase
 from typer import Argument, Exit, Typer, echo, prompt
 
-from .auth.dependencies import get_user_repository, get_user_service
+from .auth.models import User
 from .auth.schemas import UserCreate
-from .dependencies import get_async_session
+from .auth.service import UserService
+from .db.base import sessionmanager
 
 app = Typer()
 
@@ -33,23 +35,20 @@ def create_superuser():
         raise ValueError("Passwords do not match.")
 
     async def _create():
-        async for session in get_async_session():
-            async for user_repository in get_user_repository(session):
-                async for user_service in get_user_service(user_repository):
-                    try:
-                        user_create = UserCreate(
-                            email=email,
-                            password=password,
-                            is_active=True,
-                            is_superuser=True,
-                        )
-                        user = await user_service.create(user_create)
-                        echo(
-                            f"Superuser created with ID: {user.id} and email: {user.email}"
-                        )
-                    except Exception as e:
-                        echo(f"Error creating superuser: {e}")
-                        raise Exit(1)
+        async with sessionmanager.session() as session:
+            user_service = UserService(SQLAlchemyUserDatabase(session, User))
+            try:
+                user_create = UserCreate(
+                    email=email,
+                    password=password,
+                    is_active=True,
+                    is_superuser=True,
+                )
+                user = await user_service.create(user_create)
+                echo(f"Superuser created with ID: {user.id} and email: {user.email}")
+            except Exception as e:
+                echo(f"Error creating superuser: {e}")
+                raise Exit(1)
 
     asyncio.run(_create())
 
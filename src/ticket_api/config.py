@@ -1,4 +1,6 @@
+from functools import cached_property, lru_cache
 from typing import ClassVar
+
 from pydantic import PostgresDsn, computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -15,8 +17,19 @@ class Settings(BaseSettings):
     DB_PORT: int
     DB_NAME: str
 
+    # Database connection pool settings
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_USE_LIFO: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 1024
+    DB_TCP_KEEPALIVES_IDLE: int = 30
+
     @computed_field
-    @property
+    @cached_property
     def DB_URL(self) -> PostgresDsn:
         return PostgresDsn.build(
             scheme="postgresql+asyncpg",
@@ -27,6 +40,11 @@ class Settings(BaseSettings):
             path=self.DB_NAME,
         )
 
+    # Cache settings
+    TICKET_STATUS_CACHE_TTL: int = 300
+    TICKET_LIST_CACHE_TTL: int = 60
+    TICKET_LIST_CACHE_MAXSIZE: int = 10000
+
     # Auth settings
     PASSWORD_SPECIAL_CHARS: str = "!@#$%^&*?"
     SECRET_KEY: str
@@ -34,6 +52,12 @@ class Settings(BaseSettings):
     # AI settings
     OPENAI_API_KEY: str
     OPENAI_API_BASE: str
+    OPENAI_TIMEOUT: float = 60
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -1,6 +1,6 @@
 import contextlib
-from typing import AsyncIterator
-from sqlalchemy import MetaData
+from typing import Any, AsyncIterator, Callable
+from sqlalchemy import AsyncAdaptedQueuePool, MetaData, event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -8,7 +8,8 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncConnection,
 )
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import DeclarativeBase, Session
 from ..config import settings
 
 CONVENTION = {
@@ -19,6 +20,8 @@ CONVENTION = {
     "pk": "pk_%(table_name)s",
 }
 
+AFTER_COMMIT_CALLBACKS_KEY = "after_commit_callbacks"
+
 
 class Base(DeclarativeBase):
     metadata = MetaData(naming_convention=CONVENTION)
@@ -29,10 +32,14 @@ class DatabaseSessionManager:
 
     This class provides methods to create and manage database sessions, as well as to create and drop database tables.
     This is a powerful tool for managing database connections in an asynchronous environment and encapsulates the logic for handling database sessions and connections.
+
+    Args:
+        url (str): The database URL.
+        engine_kwargs (dict[str, Any] | None): Extra keyword arguments passed to `create_async_engine`, e.g. connection pool settings.
     """
 
-    def __init__(self, url: str):
-        self._engine: AsyncEngine = create_async_engine(url)
+    def __init__(self, url: str, engine_kwargs: dict[str, Any] | None = None):
+        self._engine: AsyncEngine = create_async_engine(url, **(engine_kwargs or {}))
         self._sessionmaker: AsyncSession = async_sessionmaker(
             autocommit=False,
             bind=self._engine,
@@ -82,4 +89,70 @@ class DatabaseSessionManager:
         await connection.run_sync(Base.metadata.drop_all)
 
 
-sessionmanager = DatabaseSessionManager(settings.DB_URL.unicode_string())
+def run_after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run a callback once the session's current transaction is committed.
+
+    Used for side effects that must not be visible before the data they depend on, e.g. cache invalidation:
+    invalidating before the commit lets a concurrent request cache the old rows again.
+    Callbacks of a transaction that is rolled back are discarded.
+
+    Args:
+        session (AsyncSession): The session whose transaction the callback waits for.
+        callback (Callable[[], None]): The callback to run.
+
+    """
+
+    session.info.setdefault(AFTER_COMMIT_CALLBACKS_KEY, []).append(callback)
+
+
+def violated_constraint(exc: IntegrityError) -> str | None:
+    """Get the name of the constraint that caused an integrity error.
+
+    asyncpg reports it on its own exception, which the DBAPI adapter keeps as the cause of `exc.orig`.
+
+    Args:
+        exc (IntegrityError): The error raised by the statement.
+
+    Returns:
+        str | None: The constraint name, or None if the driver didn't report one.
+
+    """
+
+    return getattr(getattr(exc.orig, "__cause__", None), "constraint_name", None)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    for callback in session.info.pop(AFTER_COMMIT_CALLBACKS_KEY, ()):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(AFTER_COMMIT_CALLBACKS_KEY, None)
+
+
+sessionmanager = DatabaseSessionManager(
+    settings.DB_URL.unicode_string(),
+    engine_kwargs={
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        # Reuse the most recently returned connection, so connections opened for a burst stay idle instead of in rotation.
+        "pool_use_lifo": settings.DB_POOL_USE_LIFO,
+        "echo": False,
+        "connect_args": {
+            "server_settings": {
+                "jit": "off",
+                "tcp_keepalives_idle": str(settings.DB_TCP_KEEPALIVES_IDLE),
+            },
+            # asyncpg's own cache, used for statements asyncpg prepares by itself.
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            # SQLAlchemy's per-connection cache of prepared statements, used for every ORM/Core query.
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+        },
+    },
+)
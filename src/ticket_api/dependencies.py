@@ -1,6 +1,42 @@
+import contextlib
+from typing import Callable
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from .db.base import sessionmanager
 
 
 async def get_async_session():
     async with sessionmanager.session() as session:
         yield session
+
+
+async def get_async_session_commit(
+    session: AsyncSession = Depends(get_async_session, use_cache=True),
+):
+    """Session dependency for endpoints that write to the database.
+
+    It shares the request's cached session and commits it once the endpoint returns successfully.
+    The exit code of dependencies with `yield` runs before the response is sent,
+    so writes are durable by the time the client receives it. If the endpoint raises, the commit is skipped
+    and the session is rolled back by the session manager.
+    """
+
+    yield session
+    await session.commit()
+
+
+SessionFactory = Callable[[], contextlib.AbstractAsyncContextManager[AsyncSession]]
+
+
+async def get_session_factory() -> SessionFactory:
+    """Session factory for work that outlives the request, e.g. background tasks started by a streaming endpoint.
+
+    Such work must not use the request's session: the pinned FastAPI (<0.116) runs the exit code
+    of dependencies with `yield` before a streaming response's body is sent, so that session is already
+    committed and closed by the time the stream ends. Each call opens a new session, which is rolled back
+    on error and closed when its `async with` block exits.
+    """
+
+    return sessionmanager.session
@@ -0,0 +1,52 @@
+import asyncio
+import functools
+from typing import Any, Callable, Coroutine
+
+from fastapi import Response, status
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+
+class ModelResponseRoute(APIRoute):
+    """Route that serializes a returned `response_model` instance without validating it again.
+
+    FastAPI validates every returned value against `response_model` before serializing it,
+    which repeats the work for endpoints that already return an instance of that model built by the service layer.
+    When the endpoint returns an instance of `response_model`, this route dumps it straight to JSON with pydantic-core
+    and returns it as a ready response. Any other value (e.g. `None` or a `Response`) goes through FastAPI as usual.
+
+    `response_model` is still used for the OpenAPI schema.
+    """
+
+    def get_route_handler(self) -> Callable[..., Coroutine[Any, Any, Response]]:
+        response_model = self.response_model
+        if (
+            isinstance(response_model, type)
+            and issubclass(response_model, BaseModel)
+            and asyncio.iscoroutinefunction(self.dependant.call)
+        ):
+            self.dependant.call = self._dump_model_responses(
+                self.dependant.call,
+                response_model,
+            )
+        return super().get_route_handler()
+
+    def _dump_model_responses(
+        self,
+        endpoint: Callable[..., Coroutine[Any, Any, Any]],
+        response_model: type[BaseModel],
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        status_code = self.status_code or status.HTTP_200_OK
+
+        @functools.wraps(endpoint)
+        async def endpoint_with_dump(*args: Any, **kwargs: Any) -> Any:
+            result = await endpoint(*args, **kwargs)
+            if type(result) is response_model:
+                return Response(
+                    content=result.model_dump_json(),
+                    status_code=status_code,
+                    media_type="application/json",
+                )
+            return result
+
+        return endpoint_with_dump
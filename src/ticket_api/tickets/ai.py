@@ -1,11 +1,26 @@
 from typing import AsyncGenerator
 
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from .schemas import MessageRead, TicketRead
 
 from ..config import settings
 
+ROLES = ("Customer", "Agent")
+
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You're a friendly and knowledgeable customer support assistant.",
+}
+
+USER_PROMPT_TEMPLATE = (
+    "A customer is facing this issue: {ticket_description}\n\n"
+    "Messages history: {message_history}\n\n"
+    "Their latest message is: {last_customer_message}\n\n"
+    "Please craft a helpful and thoughtful response to assist them."
+)
+
 
 class AIService:
     """Class to handle AI interactions for ticket responses.
@@ -14,17 +29,36 @@ class AIService:
     It utilizes the OpenAI API to create a chat completion based on the provided ticket and message history.
     OpenAI usage lets it work with different models that support similar interfaces.
 
+    A single instance is created for the application lifetime (see `api.py`),
+    so the underlying HTTP connection pool is reused across requests.
+
     Attributes:
         client (AsyncOpenAI): An instance of the OpenAI API client for making requests.
 
     """
 
+    __slots__ = ("client",)
+
     def __init__(self):
         self.client = AsyncOpenAI(
             api_key=settings.OPENAI_API_KEY,
             base_url=settings.OPENAI_API_BASE,
+            # httpx applies it per operation: connecting, and waiting for each chunk of a stream, not to the whole response.
+            timeout=settings.OPENAI_TIMEOUT,
+            # Keeps the SDK's client defaults, e.g. following redirects, and only widens the pool.
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_keepalive_connections=50,
+                    max_connections=100,
+                ),
+            ),
         )
 
+    async def close(self) -> None:
+        """Closes the underlying HTTP client and its connection pool."""
+
+        await self.client.close()
+
     def build_prompt(
         self,
         ticket: TicketRead,
@@ -43,12 +77,8 @@ class AIService:
 
         """
 
-        ticket_description = ticket.description
         message_history_str = "\n".join(
-            [
-                f"{'Agent' if msg.is_ai else 'Customer'}: {msg.content}"
-                for msg in message_history
-            ]
+            f"{ROLES[msg.is_ai]}: {msg.content}" for msg in message_history
         )
         last_customer_message_str = (
             f"Customer: {last_customer_message.content}"
@@ -57,17 +87,13 @@ class AIService:
         )
 
         return [
-            {
-                "role": "system",
-                "content": "You're a friendly and knowledgeable customer support assistant.",
-            },
+            SYSTEM_MESSAGE,
             {
                 "role": "user",
-                "content": (
-                    f"A customer is facing this issue: {ticket_description}\n\n"
-                    f"Messages history: {message_history_str}\n\n"
-                    f"Their latest message is: {last_customer_message_str}\n\n"
-                    "Please craft a helpful and thoughtful response to assist them."
+                "content": USER_PROMPT_TEMPLATE.format(
+                    ticket_description=ticket.description,
+                    message_history=message_history_str,
+                    last_customer_message=last_customer_message_str,
                 ),
             },
         ]
@@ -79,6 +105,7 @@ class AIService:
         """Streams the response from the AI model.
 
         It uses the OpenAI API to create a chat completion and yields the response chunks as they are received.
+        Chunks without content (e.g. the role-only first chunk or the final chunk carrying `finish_reason`) are skipped.
 
         Args:
             prompt (list[dict[str, str]]): The prompt to be sent to the AI model.
@@ -98,4 +125,9 @@ class AIService:
         )
 
         async for chunk in stream:
-            yield chunk.choices[0].delta.content
+            choices = chunk.choices
+            if not choices:
+                continue
+            content = choices[0].delta.content
+            if content:
+                yield content
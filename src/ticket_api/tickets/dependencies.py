@@ -1,49 +1,100 @@
-from typing import AsyncGenerator
-from fastapi import Depends
-from fastapi_users_db_sqlalchemy import SQLAlchemyUserDatabase
+import asyncio
+import contextlib
+from typing import AsyncGenerator, AsyncIterator, Callable
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ticket_api.tickets.ai import AIService
 
-from ..auth.dependencies import get_user_repository
-from ..dependencies import get_async_session
+from ..cache import TTLCache
+from ..config import settings
+from ..dependencies import SessionFactory, get_async_session_commit, get_session_factory
 from .repository import MessageRepository, TicketRepository, TicketStatusRepository
 from .service import TicketService
 
 
 async def get_ticket_repository(
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_session_commit, use_cache=True),
 ) -> AsyncGenerator[TicketService, None]:
     yield TicketRepository(session)
 
 
 async def get_ticket_status_repository(
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_session_commit, use_cache=True),
 ) -> AsyncGenerator[TicketService, None]:
     yield TicketStatusRepository(session)
 
 
 async def get_message_repository(
-    session: AsyncSession = Depends(get_async_session),
+    session: AsyncSession = Depends(get_async_session_commit, use_cache=True),
 ) -> AsyncGenerator[TicketService, None]:
     yield MessageRepository(session)
 
 
+ticket_status_cache = TTLCache(ttl=settings.TICKET_STATUS_CACHE_TTL)
+
+
+async def get_ticket_status_cache() -> TTLCache:
+    return ticket_status_cache
+
+
+ticket_list_cache = TTLCache(
+    ttl=settings.TICKET_LIST_CACHE_TTL,
+    maxsize=settings.TICKET_LIST_CACHE_MAXSIZE,
+)
+
+
+async def get_ticket_list_cache() -> TTLCache:
+    return ticket_list_cache
+
+
 async def get_ticket_service(
     ticket_repository: TicketRepository = Depends(get_ticket_repository),
     ticket_status_repository: TicketStatusRepository = Depends(
         get_ticket_status_repository
     ),
     message_repository: MessageRepository = Depends(get_message_repository),
-    user_repository: SQLAlchemyUserDatabase = Depends(get_user_repository),
+    ticket_status_cache: TTLCache = Depends(get_ticket_status_cache),
+    ticket_list_cache: TTLCache = Depends(get_ticket_list_cache),
 ) -> AsyncGenerator[TicketService, None]:
     yield TicketService(
         ticket_repository=ticket_repository,
         ticket_status_repository=ticket_status_repository,
         message_repository=message_repository,
-        user_repository=user_repository,
+        ticket_status_cache=ticket_status_cache,
+        ticket_list_cache=ticket_list_cache,
     )
 
 
-async def get_ai_service() -> AsyncGenerator[AIService, None]:
-    yield AIService()
+TicketServiceFactory = Callable[
+    [], contextlib.AbstractAsyncContextManager[TicketService]
+]
+
+
+async def get_ticket_service_factory(
+    session_factory: SessionFactory = Depends(get_session_factory),
+    ticket_status_cache: TTLCache = Depends(get_ticket_status_cache),
+    ticket_list_cache: TTLCache = Depends(get_ticket_list_cache),
+) -> TicketServiceFactory:
+    """Factory of ticket services bound to their own session, for work that outlives the request."""
+
+    @contextlib.asynccontextmanager
+    async def ticket_service_factory() -> AsyncIterator[TicketService]:
+        async with session_factory() as session:
+            yield TicketService(
+                ticket_repository=TicketRepository(session),
+                ticket_status_repository=TicketStatusRepository(session),
+                message_repository=MessageRepository(session),
+                ticket_status_cache=ticket_status_cache,
+                ticket_list_cache=ticket_list_cache,
+            )
+
+    return ticket_service_factory
+
+
+async def get_ai_service(request: Request) -> AIService:
+    return request.app.state.ai_service
+
+
+async def get_background_tasks(request: Request) -> set[asyncio.Task]:
+    return request.app.state.background_tasks
@@ -1,8 +1,8 @@
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, func
+from sqlalchemy import DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..db.base import Base
@@ -19,6 +19,9 @@ class TicketStatus(Base):
     Also, used migration system does not support Enum updates well.
     This allows for easy addition, removal, or modification of ticket statuses without requiring database migrations.
 
+    `tickets` is never loaded implicitly, as a status can be shared by every ticket in the system.
+    Load it explicitly with `selectinload(TicketStatus.tickets)` when needed.
+
     Attributes:
         id (UUID): Unique identifier for the ticket status.
         name (str): Name of the ticket status.
@@ -28,12 +31,15 @@ class TicketStatus(Base):
 
     __tablename__ = "ticket_statuses"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    )
     name: Mapped[str] = mapped_column(unique=True, nullable=False)
 
     tickets: Mapped[list["Ticket"]] = relationship(
         back_populates="status",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
 
@@ -42,6 +48,11 @@ class Ticket(Base):
 
     This model represents a support ticket in the system, including its title, description, status, and associated messages.
 
+    `status` and `messages` are eagerly loaded since every ticket response includes them,
+    `messages` are ordered by `created_at`, so a loaded ticket carries its whole conversation in order.
+    `user` is never loaded implicitly to avoid the circular `User.tickets` <-> `Ticket.user` eager load,
+    use `selectinload(Ticket.user)` at the query site when it's needed.
+
     Attributes:
         id (UUID): Unique identifier for the ticket.
         title (str): Title of the ticket.
@@ -57,25 +68,29 @@ class Ticket(Base):
 
     __tablename__ = "tickets"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    )
     title: Mapped[str] = mapped_column(nullable=False)
     description: Mapped[str] = mapped_column(nullable=False, default="")
     user_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE")
+        ForeignKey("users.id", ondelete="CASCADE"), index=True
     )
     status_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("ticket_statuses.id", ondelete="SET NULL"), nullable=True
+        ForeignKey("ticket_statuses.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
-        default=datetime.now(timezone.utc),
     )
 
     user: Mapped["User"] = relationship(
         back_populates="tickets",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     status: Mapped["TicketStatus"] = relationship(
         back_populates="tickets",
@@ -84,6 +99,7 @@ class Ticket(Base):
     messages: Mapped[list["Message"]] = relationship(
         back_populates="ticket",
         lazy="selectin",
+        order_by="Message.created_at",
     )
 
 
@@ -92,6 +108,8 @@ class Message(Base):
 
     This model represents a message exchanged in a support ticket, including its content, whether it's from an AI, and the timestamp of creation.
 
+    `ticket` is never loaded implicitly, use `selectinload(Message.ticket)` at the query site when it's needed.
+
     Attributes:
         id (UUID): Unique identifier for the message.
         ticket_id (UUID): ID of the ticket associated with this message.
@@ -103,8 +121,21 @@ class Message(Base):
     """
 
     __tablename__ = "messages"
+    __table_args__ = (
+        # Serves both the `ticket_id` lookups and the per-ticket ordering by `created_at`,
+        # `is_ai` lets the last customer message lookup skip AI messages without visiting the table.
+        Index(
+            "ix_messages_ticket_id_created_at_is_ai",
+            "ticket_id",
+            "created_at",
+            "is_ai",
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        server_default=func.gen_random_uuid(),
+    )
     ticket_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("tickets.id", ondelete="CASCADE")
     )
@@ -114,10 +145,9 @@ class Message(Base):
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
-        default=datetime.now(timezone.utc),
     )
 
     ticket: Mapped["Ticket"] = relationship(
         back_populates="messages",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
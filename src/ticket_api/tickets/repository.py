@@ -1,10 +1,32 @@
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import insert, select, update, delete, exists
+from sqlalchemy import insert, lambda_stmt, select, update, delete, exists
+from sqlalchemy.orm import joinedload, noload, raiseload, selectinload
+from ..auth.models import User
 from .models import Ticket, TicketStatus, Message
 from .schemas import MessageCreate, TicketCreate, TicketStatusCreate, TicketUpdate
 from ..db.repository import BaseRepository
 
+# Relationships serialized by `TicketRead`, any other relationship access raises instead of emitting a query.
+# The many-to-one `status` is joined into the ticket query, the one-to-many `messages` is loaded with one `IN` query.
+TICKET_LOADER_OPTIONS = (
+    joinedload(Ticket.status),
+    selectinload(Ticket.messages),
+    raiseload("*"),
+)
+# `INSERT/UPDATE ... RETURNING` can't be joined to other tables, so mutations load `status` with a separate query.
+TICKET_RETURNING_LOADER_OPTIONS = (
+    selectinload(Ticket.status),
+    selectinload(Ticket.messages),
+    raiseload("*"),
+)
+# A ticket that was just inserted can't have messages yet, so they are set to an empty list without a query.
+TICKET_CREATE_LOADER_OPTIONS = (
+    selectinload(Ticket.status),
+    noload(Ticket.messages),
+    raiseload("*"),
+)
+
 
 class TicketRepository(BaseRepository):
     """Repository for managing tickets in the database.
@@ -21,6 +43,15 @@ class TicketRepository(BaseRepository):
     making the code more modular and easier to maintain.
 
     The repository is initialized with an asynchronous session, which is used for all database operations.
+    Repositories never commit: the session is a unit of work shared by all repositories of a request,
+    and it is committed once by the `get_async_session_commit` dependency when the request succeeds.
+    Mutations use `RETURNING` to get the affected row back in the same round trip.
+
+    Every query loads exactly the relationships needed by `TicketRead` (see `TICKET_LOADER_OPTIONS`),
+    so list endpoints issue a fixed number of queries regardless of the number of tickets.
+
+    Parametrized hot-path queries are built with `lambda_stmt`: the statement is constructed and its cache key
+    computed once per call site, later calls only extract the closure variables as bound parameters.
     """
 
     def __init__(self, session: AsyncSession):
@@ -37,12 +68,15 @@ class TicketRepository(BaseRepository):
 
         """
 
-        ticket_data = ticket_create.model_dump(mode="json")
-        stmt = insert(Ticket).values(**ticket_data).returning(Ticket.id)
+        ticket_data = ticket_create.model_dump()
+        stmt = (
+            insert(Ticket)
+            .values(**ticket_data)
+            .returning(Ticket)
+            .options(*TICKET_CREATE_LOADER_OPTIONS)
+        )
         result = await self.session.execute(stmt)
-        ticket_id = result.scalar_one()
-        await self.session.commit()
-        return await self.get(ticket_id)
+        return result.scalar_one()
 
     async def exists(self, ticket_id: uuid.UUID) -> bool:
         """Check if a ticket exists in the database.
@@ -55,13 +89,36 @@ class TicketRepository(BaseRepository):
 
         """
 
-        stmt = select(exists().where(Ticket.id == ticket_id))
+        stmt = lambda_stmt(lambda: select(exists().where(Ticket.id == ticket_id)))
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
+
+    async def user_exists(self, user_id: uuid.UUID) -> bool:
+        """Check if a user, the owner of tickets, exists in the database.
+
+        Loading a `User` eagerly loads all of its tickets with their statuses and messages,
+        so checks that only need to know whether the user exists use this scalar query instead.
+
+        Args:
+            user_id (uuid.UUID): The ID of the user to check.
+
+        Returns:
+            bool: True if the user exists, False otherwise.
+
+        """
+
+        # fastapi-users types `User.id` as a plain UUID for type checkers, so the table column is compared instead.
+        stmt = lambda_stmt(
+            lambda: select(exists().where(User.__table__.c.id == user_id))
+        )
         result = await self.session.execute(stmt)
         return result.scalar_one()
 
     async def get(self, ticket_id: uuid.UUID) -> Ticket | None:
         """Get a ticket by its ID.
 
+        It uses the session's identity map, so a ticket already loaded in the current session is returned without a query.
+
         Args:
             ticket_id (uuid.UUID): The ID of the ticket to retrieve.
 
@@ -70,36 +127,102 @@ class TicketRepository(BaseRepository):
 
         """
 
-        stmt = select(Ticket).where(Ticket.id == ticket_id)
+        return await self.session.get(Ticket, ticket_id, options=TICKET_LOADER_OPTIONS)
+
+    async def get_user_id(self, ticket_id: uuid.UUID) -> uuid.UUID | None:
+        """Get the ID of the user who owns a ticket.
+
+        Only the `user_id` column is selected, which is all that access checks need.
+
+        Args:
+            ticket_id (uuid.UUID): The ID of the ticket.
+
+        Returns:
+            uuid.UUID | None: The owner's ID if the ticket is found, None otherwise.
+
+        """
+
+        stmt = lambda_stmt(lambda: select(Ticket.user_id).where(Ticket.id == ticket_id))
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_all(self) -> list[Ticket]:
-        """Get all tickets in the database.
+    async def get_all(self) -> list[dict]:
+        """Get all tickets in the database as plain dictionaries shaped like `TicketRead`.
+
+        See `get_all_by_user`.
 
         Returns:
-            list[Ticket]: A list of all ticket objects.
+            list[dict]: A list of all tickets with their status and messages.
 
         """
 
-        stmt = select(Ticket)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        return await self._get_projected()
 
-    async def get_all_by_user(self, user_id: uuid.UUID) -> list[Ticket]:
-        """Get all tickets for a specific user.
+    async def get_all_by_user(self, user_id: uuid.UUID) -> list[dict]:
+        """Get all tickets for a specific user as plain dictionaries shaped like `TicketRead`.
+
+        Only the serialized columns are selected and read with `mappings()`,
+        so no ORM objects are hydrated or tracked in the session's identity map.
+        Tickets are joined with their status, messages are fetched with one more query for all tickets.
 
         Args:
             user_id (uuid.UUID): The ID of the user whose tickets to retrieve.
 
         Returns:
-            list[Ticket]: A list of all ticket objects for the specified user.
+            list[dict]: A list of tickets with their status and messages for the specified user.
 
         """
 
-        stmt = select(Ticket).where(Ticket.user_id == user_id)
-        result = await self.session.execute(stmt)
-        return result.scalars().all()
+        return await self._get_projected(Ticket.user_id == user_id)
+
+    async def _get_projected(self, *criteria) -> list[dict]:
+        ticket_stmt = (
+            select(
+                Ticket.id,
+                Ticket.title,
+                Ticket.description,
+                Ticket.user_id,
+                Ticket.status_id,
+                Ticket.created_at,
+                TicketStatus.name.label("status_name"),
+            )
+            .outerjoin(TicketStatus, Ticket.status_id == TicketStatus.id)
+            .where(*criteria)
+        )
+        result = await self.session.execute(ticket_stmt)
+
+        tickets = {}
+        for row in result.mappings():
+            ticket = dict(row)
+            status_name = ticket.pop("status_name")
+            ticket["status"] = (
+                None
+                if status_name is None
+                else {"id": ticket["status_id"], "name": status_name}
+            )
+            ticket["messages"] = []
+            tickets[ticket["id"]] = ticket
+
+        if not tickets:
+            return []
+
+        message_stmt = (
+            select(
+                Message.id,
+                Message.ticket_id,
+                Message.content,
+                Message.is_ai,
+                Message.created_at,
+            )
+            .join(Ticket, Message.ticket_id == Ticket.id)
+            .where(*criteria)
+            .order_by(Message.created_at)
+        )
+        result = await self.session.execute(message_stmt)
+        for row in result.mappings():
+            tickets[row["ticket_id"]]["messages"].append(dict(row))
+
+        return list(tickets.values())
 
     async def update(self, ticket_id: uuid.UUID, ticket_update: TicketUpdate) -> Ticket:
         """Update a ticket by its ID.
@@ -115,31 +238,42 @@ class TicketRepository(BaseRepository):
         Returns:
             Ticket: The updated ticket object.
 
+        Raises:
+            NoResultFound: If the ticket is not found.
+            IntegrityError: If the ticket status is not found.
+
         """
 
-        ticket_data = ticket_update.model_dump(mode="json", exclude_unset=True)
+        ticket_data = ticket_update.model_dump(exclude_unset=True)
         stmt = (
             update(Ticket)
             .where(Ticket.id == ticket_id)
             .values(**ticket_data)
-            .returning(Ticket.id)
+            .returning(Ticket)
+            .options(*TICKET_RETURNING_LOADER_OPTIONS)
+            .execution_options(populate_existing=True)
         )
         result = await self.session.execute(stmt)
-        ticket_id = result.scalar_one()
-        await self.session.commit()
-        return await self.get(ticket_id)
+        return result.scalar_one()
 
-    async def delete(self, ticket_id: uuid.UUID) -> None:
+    async def delete(self, ticket_id: uuid.UUID) -> uuid.UUID | None:
         """Delete a ticket by its ID.
 
         Args:
             ticket_id (uuid.UUID): The ID of the ticket to delete.
 
+        Returns:
+            uuid.UUID | None: The ID of the deleted ticket's owner, None if the ticket is not found.
+
         """
 
-        stmt = delete(Ticket).where(Ticket.id == ticket_id)
-        await self.session.execute(stmt)
-        await self.session.commit()
+        stmt = lambda_stmt(
+            lambda: delete(Ticket)
+            .where(Ticket.id == ticket_id)
+            .returning(Ticket.user_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
 
 
 class TicketStatusRepository:
@@ -159,14 +293,10 @@ class TicketStatusRepository:
 
         """
 
-        ticket_status_data = ticket_status_create.model_dump(mode="json")
-        stmt = (
-            insert(TicketStatus).values(**ticket_status_data).returning(TicketStatus.id)
-        )
+        ticket_status_data = ticket_status_create.model_dump()
+        stmt = insert(TicketStatus).values(**ticket_status_data).returning(TicketStatus)
         result = await self.session.execute(stmt)
-        ticket_status_id = result.scalar_one()
-        await self.session.commit()
-        return await self.get(ticket_status_id)
+        return result.scalar_one()
 
     async def exists(self, ticket_status_id: uuid.UUID) -> bool:
         """Check if a ticket status exists in the database.
@@ -179,13 +309,17 @@ class TicketStatusRepository:
 
         """
 
-        stmt = select(exists().where(TicketStatus.id == ticket_status_id))
+        stmt = lambda_stmt(
+            lambda: select(exists().where(TicketStatus.id == ticket_status_id))
+        )
         result = await self.session.execute(stmt)
         return result.scalar_one()
 
     async def get(self, ticket_status_id: uuid.UUID) -> TicketStatus | None:
         """Get a ticket status by its ID.
 
+        It uses the session's identity map, so a ticket status already loaded in the current session is returned without a query.
+
         Args:
             ticket_status_id (uuid.UUID): The ID of the ticket status to retrieve.
 
@@ -194,9 +328,7 @@ class TicketStatusRepository:
 
         """
 
-        stmt = select(TicketStatus).where(TicketStatus.id == ticket_status_id)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await self.session.get(TicketStatus, ticket_status_id)
 
     async def get_all(self) -> list[TicketStatus]:
         """Get all ticket statuses in the database.
@@ -210,17 +342,24 @@ class TicketStatusRepository:
         result = await self.session.execute(stmt)
         return result.scalars().all()
 
-    async def delete(self, ticket_status_id: uuid.UUID) -> None:
+    async def delete(self, ticket_status_id: uuid.UUID) -> bool:
         """Delete a ticket status by its ID.
 
         Args:
             ticket_status_id (uuid.UUID): The ID of the ticket status to delete.
 
+        Returns:
+            bool: True if the ticket status was deleted, False if it was not found.
+
         """
 
-        stmt = delete(TicketStatus).where(TicketStatus.id == ticket_status_id)
-        await self.session.execute(stmt)
-        await self.session.commit()
+        stmt = lambda_stmt(
+            lambda: delete(TicketStatus)
+            .where(TicketStatus.id == ticket_status_id)
+            .returning(TicketStatus.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none() is not None
 
 
 class MessageRepository:
@@ -245,13 +384,11 @@ class MessageRepository:
 
         """
 
-        message_data = message_create.model_dump(mode="json")
+        message_data = message_create.model_dump()
         message_data["ticket_id"] = ticket_id
-        stmt = insert(Message).values(**message_data).returning(Message.id)
+        stmt = insert(Message).values(**message_data).returning(Message)
         result = await self.session.execute(stmt)
-        message_id = result.scalar_one()
-        await self.session.commit()
-        return await self.get(message_id)
+        return result.scalar_one()
 
     async def exists(self, message_id: uuid.UUID) -> bool:
         """Check if a message exists in the database.
@@ -264,13 +401,15 @@ class MessageRepository:
 
         """
 
-        stmt = select(exists().where(Message.id == message_id))
+        stmt = lambda_stmt(lambda: select(exists().where(Message.id == message_id)))
         result = await self.session.execute(stmt)
         return result.scalar_one()
 
     async def get(self, message_id: uuid.UUID) -> Message | None:
         """Get a message by its ID.
 
+        It uses the session's identity map, so a message already loaded in the current session is returned without a query.
+
         Args:
             message_id (uuid.UUID): The ID of the message to retrieve.
 
@@ -279,9 +418,7 @@ class MessageRepository:
 
         """
 
-        stmt = select(Message).where(Message.id == message_id)
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await self.session.get(Message, message_id)
 
     async def get_all_by_ticket(
         self,
@@ -299,8 +436,8 @@ class MessageRepository:
 
         """
 
-        stmt = (
-            select(Message)
+        stmt = lambda_stmt(
+            lambda: select(Message)
             .where(Message.ticket_id == ticket_id)
             .order_by(Message.created_at.asc())
         )
@@ -321,8 +458,8 @@ class MessageRepository:
 
         """
 
-        stmt = (
-            select(Message)
+        stmt = lambda_stmt(
+            lambda: select(Message)
             .where(Message.ticket_id == ticket_id, Message.is_ai.is_(False))
             .order_by(Message.created_at.desc())
             .limit(1)
@@ -1,12 +1,22 @@
+import asyncio
+import logging
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 from sse_starlette.sse import EventSourceResponse
 
 from ..auth.router import get_current_active_superuser, get_current_active_user
 from ..auth.schemas import UserRead
+from ..routing import ModelResponseRoute
 from .ai import AIService
-from .dependencies import get_ai_service, get_ticket_service
+from .dependencies import (
+    TicketServiceFactory,
+    get_ai_service,
+    get_background_tasks,
+    get_ticket_service,
+    get_ticket_service_factory,
+)
 from .schemas import (
     MessageCreate,
     MessageRead,
@@ -18,7 +28,12 @@ from .schemas import (
 )
 from .service import TicketService
 
-router = APIRouter()
+logger = logging.getLogger(__name__)
+
+router = APIRouter(
+    route_class=ModelResponseRoute,
+    default_response_class=ORJSONResponse,
+)
 
 
 @router.post(
@@ -45,12 +60,17 @@ async def create_ticket_status(
 async def get_all_ticket_statuses(
     ticket_service: TicketService = Depends(get_ticket_service),
     _: UserRead = Depends(get_current_active_user),
-) -> list[TicketStatusRead]:
+) -> Response:
     """
     Get all ticket statuses.
+
+    The response body is rendered once and served from the ticket status cache until statuses change.
     """
 
-    return await ticket_service.get_all_ticket_statuses()
+    return Response(
+        content=await ticket_service.get_all_ticket_statuses_json(),
+        media_type="application/json",
+    )
 
 
 @router.delete(
@@ -76,11 +96,17 @@ async def delete_ticket_status(
 async def get_all_tickets(
     ticket_service: TicketService = Depends(get_ticket_service),
     current_user: UserRead = Depends(get_current_active_user),
-) -> list[TicketRead]:
+) -> Response:
     """
     Get all tickets.
+
+    The response body is rendered once and served from the ticket list cache until the user's tickets change.
     """
-    return await ticket_service.get_all_tickets_by_user(current_user.id)
+
+    return Response(
+        content=await ticket_service.get_all_tickets_by_user_json(current_user.id),
+        media_type="application/json",
+    )
 
 
 @router.post(
@@ -125,9 +151,7 @@ async def get_ticket(
     Get a ticket by ID.
     """
 
-    await ticket_service.is_ticket_accessible(ticket_id, current_user.id)
-
-    return await ticket_service.get_ticket(ticket_id)
+    return await ticket_service.get_ticket_for_user(ticket_id, current_user)
 
 
 @router.put(
@@ -143,7 +167,7 @@ async def update_ticket(
     """
     Update a ticket by ID.
     """
-    await ticket_service.is_ticket_accessible(ticket_id, current_user.id)
+    await ticket_service.check_ticket_access(ticket_id, current_user)
 
     return await ticket_service.update_ticket(ticket_id, ticket_update)
 
@@ -160,7 +184,7 @@ async def delete_ticket(
     """
     Delete a ticket by ID.
     """
-    await ticket_service.is_ticket_accessible(ticket_id, current_user.id)
+    await ticket_service.check_ticket_access(ticket_id, current_user)
 
     await ticket_service.delete_ticket(ticket_id)
 
@@ -186,7 +210,7 @@ async def create_message(
             detail="AI messages cannot be created manually.",
         )
 
-    await ticket_service.is_ticket_accessible(ticket_id, current_user.id)
+    await ticket_service.check_ticket_access(ticket_id, current_user)
 
     return await ticket_service.create_message(ticket_id, message_create)
 
@@ -201,6 +225,8 @@ async def stream_ai_response(
     ticket_service: TicketService = Depends(get_ticket_service),
     ai_service: AIService = Depends(get_ai_service),
     current_user: UserRead = Depends(get_current_active_user),
+    background_tasks: set[asyncio.Task] = Depends(get_background_tasks),
+    ticket_service_factory: TicketServiceFactory = Depends(get_ticket_service_factory),
 ) -> EventSourceResponse:
     """
     Stream AI response for a ticket.
@@ -208,34 +234,44 @@ async def stream_ai_response(
     This endpoint streams the AI-generated response for a ticket in real-time using Server-Sent Events (SSE).
     The AI model processes the ticket description and message history to generate a response.
     After this, to keep track of the conversation, the AI response is saved as a message in the ticket.
+    The message is saved in a background task, so the stream is closed as soon as the last chunk is sent.
 
     """
-    await ticket_service.is_ticket_accessible(ticket_id, current_user.id)
-
-    ticket = await ticket_service.get_ticket(ticket_id)
-    message_history = await ticket_service.get_ticket_messages(ticket_id)
-    customer_last_message = await ticket_service.get_last_customer_message(
-        ticket_id=ticket_id,
+    # The ticket is loaded with its ordered messages, so the history is taken from it instead of further queries.
+    ticket = await ticket_service.get_ticket_for_user(ticket_id, current_user)
+    message_history = ticket.messages
+    customer_last_message = next(
+        (message for message in reversed(message_history) if not message.is_ai),
+        None,
     )
 
     prompt = ai_service.build_prompt(ticket, message_history, customer_last_message)
 
+    async def save_ai_message(content: str):
+        message_create = MessageCreate(
+            content=content,
+            is_ai=True,
+        )
+        try:
+            # The request's session was already committed and closed when the endpoint returned.
+            async with ticket_service_factory() as background_ticket_service:
+                await background_ticket_service.create_message(
+                    ticket_id=ticket_id,
+                    message_create=message_create,
+                )
+                await background_ticket_service.commit()
+        except Exception:
+            logger.exception("Failed to save AI response for ticket %s.", ticket_id)
+
     async def event_generator():
-        content = ""
+        parts: list[str] = []
 
         async for chunk in ai_service.stream_response(prompt):
-            if chunk is None:
-                break
-            content += chunk
+            parts.append(chunk)
             yield chunk
 
-        message_create = MessageCreate(
-            content=content,
-            is_ai=True,
-        )
-        await ticket_service.create_message(
-            ticket_id=ticket_id,
-            message_create=message_create,
-        )
+        task = asyncio.create_task(save_ai_message("".join(parts)))
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
 
     return EventSourceResponse(event_generator())
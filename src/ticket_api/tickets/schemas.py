@@ -1,26 +1,24 @@
 from datetime import datetime
+from typing import Annotated
 import uuid
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
 
 
 class TicketStatusBase(BaseModel):
-    name: str
-
-    @field_validator("name", mode="before")
-    @classmethod
-    def validate_name(cls, value: str) -> str:
-        value = value.lower().strip()
-        if not value:
-            raise ValueError("Name cannot be empty.")
-        return value
+    # Normalized and checked by pydantic-core itself, without calling back into a Python validator.
+    name: Annotated[
+        str,
+        StringConstraints(strip_whitespace=True, to_lower=True, min_length=1),
+    ]
 
 
 class TicketStatusCreate(TicketStatusBase):
     pass
 
 
+# Read models are frozen: the service caches them and hands the same instances to every request.
 class TicketStatusRead(TicketStatusBase):
-    model_config: ConfigDict = ConfigDict(from_attributes=True)
+    model_config: ConfigDict = ConfigDict(from_attributes=True, frozen=True)
 
     id: uuid.UUID
 
@@ -42,7 +40,7 @@ class TicketUpdate(TicketBase):
 
 
 class TicketRead(TicketBase):
-    model_config: ConfigDict = ConfigDict(from_attributes=True)
+    model_config: ConfigDict = ConfigDict(from_attributes=True, frozen=True)
 
     id: uuid.UUID
     user_id: uuid.UUID
@@ -61,9 +59,14 @@ class MessageCreate(MessageBase):
 
 
 class MessageRead(MessageBase):
-    model_config: ConfigDict = ConfigDict(from_attributes=True)
+    model_config: ConfigDict = ConfigDict(from_attributes=True, frozen=True)
 
     id: uuid.UUID
     is_ai: bool
     ticket_id: uuid.UUID
     created_at: datetime
+
+
+# List validators/serializers compiled once, a whole list is handled in a single pydantic-core call.
+ticket_status_list_adapter = TypeAdapter(list[TicketStatusRead])
+ticket_list_adapter = TypeAdapter(list[TicketRead])
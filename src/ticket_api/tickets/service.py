@@ -1,9 +1,13 @@
+import functools
 import uuid
+from typing import Hashable
 
 from fastapi import HTTPException, status
-from fastapi_users.db import SQLAlchemyUserDatabase
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, NoResultFound
 
+from ..auth.schemas import UserRead
+from ..cache import TTLCache
+from ..db.base import run_after_commit, violated_constraint
 from .repository import MessageRepository, TicketRepository, TicketStatusRepository
 from .schemas import (
     MessageCreate,
@@ -13,24 +17,24 @@ from .schemas import (
     TicketStatusCreate,
     TicketStatusRead,
     TicketUpdate,
+    ticket_list_adapter,
+    ticket_status_list_adapter,
 )
 
-
-def is_valid_uuid(uuid_to_test: str) -> bool:
-    """Check if a string is a valid UUID.
-
-    Args:
-        uuid_to_test (str): The string to check.
-
-    Returns:
-        bool: True if the string is a valid UUID, False otherwise.
-
-    """
-    try:
-        uuid.UUID(str(uuid_to_test), version=4)
-        return True
-    except ValueError:
-        return False
+# Constraint names follow the naming convention of `Base.metadata`.
+TICKET_USER_FOREIGN_KEY = "fk_tickets_user_id_users"
+TICKET_STATUS_FOREIGN_KEY = "fk_tickets_status_id_ticket_statuses"
+TICKET_STATUS_NAME_UNIQUE = "uq_ticket_statuses_name"
+
+ALL_TICKET_STATUSES_KEY = "all"
+ALL_TICKET_STATUSES_JSON_KEY = "all_json"
+ALL_TICKET_STATUS_IDS_KEY = "all_ids"
+# Everything derived from the full list of statuses, invalidated together whenever a status is created or deleted.
+ALL_TICKET_STATUSES_KEYS = (
+    ALL_TICKET_STATUSES_KEY,
+    ALL_TICKET_STATUSES_JSON_KEY,
+    ALL_TICKET_STATUS_IDS_KEY,
+)
 
 
 class TicketService:
@@ -46,7 +50,8 @@ class TicketService:
         ticket_repository (TicketRepository): Repository for managing tickets.
         ticket_status_repository (TicketStatusRepository): Repository for managing ticket statuses.
         message_repository (MessageRepository): Repository for managing messages.
-        user_repository (SQLAlchemyUserDatabase): Additional repository to validate if the user exists and has the right permissions.
+        ticket_status_cache (TTLCache): Cache of ticket statuses, keyed by ID, and of the views of all statuses under `ALL_TICKET_STATUSES_KEYS`.
+        ticket_list_cache (TTLCache): Cache of each user's tickets and their rendered JSON, keyed by user ID.
     """
 
     def __init__(
@@ -54,12 +59,40 @@ class TicketService:
         ticket_repository: TicketRepository,
         ticket_status_repository: TicketStatusRepository,
         message_repository: MessageRepository,
-        user_repository: SQLAlchemyUserDatabase,
+        ticket_status_cache: TTLCache,
+        ticket_list_cache: TTLCache,
     ):
         self.ticket_repository = ticket_repository
         self.ticket_status_repository = ticket_status_repository
         self.message_repository = message_repository
-        self.user_repository = user_repository
+        self.ticket_status_cache = ticket_status_cache
+        self.ticket_list_cache = ticket_list_cache
+
+    async def commit(self) -> None:
+        """Commit the current unit of work.
+
+        All repositories share the request's session and never commit on their own.
+        Endpoints are committed by the `get_async_session_commit` dependency, so this is only needed
+        for work done after the endpoint has returned, e.g. while streaming a response.
+
+        """
+
+        await self.ticket_repository.session.commit()
+
+    def _invalidate(self, cache: TTLCache, *keys: Hashable) -> None:
+        """Remove entries from a cache once the current unit of work is committed.
+
+        Until then other requests still read the old rows, so evicting earlier would let them cache those rows again.
+
+        Args:
+            cache (TTLCache): The cache to remove the entries from.
+            *keys (Hashable): The keys to remove.
+
+        """
+
+        run_after_commit(
+            self.ticket_repository.session, functools.partial(cache.delete, *keys)
+        )
 
     async def create_ticket(self, ticket_create: TicketCreate) -> TicketRead:
         """Create a new ticket.
@@ -75,19 +108,30 @@ class TicketService:
 
         """
 
-        if not await self.user_repository.get(ticket_create.user_id):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found",
-            )
-
-        if not await self.ticket_status_repository.exists(ticket_create.status_id):
+        if not await self.ticket_status_exists(ticket_create.status_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Ticket status not found",
             )
 
-        db_ticket = await self.ticket_repository.create(ticket_create)
+        # The status check can be served from the cache, so the status may still be gone by the time of the insert.
+        try:
+            db_ticket = await self.ticket_repository.create(ticket_create)
+        except IntegrityError as exc:
+            constraint = violated_constraint(exc)
+            if constraint == TICKET_USER_FOREIGN_KEY:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="User not found",
+                )
+            if constraint == TICKET_STATUS_FOREIGN_KEY:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Ticket status not found",
+                )
+            raise
+
+        self._invalidate(self.ticket_list_cache, db_ticket.user_id)
         return TicketRead.model_validate(db_ticket)
 
     async def get_ticket(self, ticket_id: uuid.UUID) -> TicketRead:
@@ -101,16 +145,9 @@ class TicketService:
 
         Raises:
             HTTPException[status_code=404]: If the ticket is not found.
-            HTTPException[status_code=422]: If the ticket ID is not a valid UUID.
 
         """
 
-        if not is_valid_uuid(ticket_id):
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Invalid ticket ID",
-            )
-
         db_ticket = await self.ticket_repository.get(ticket_id)
         if not db_ticket:
             raise HTTPException(
@@ -128,11 +165,14 @@ class TicketService:
         """
 
         db_tickets = await self.ticket_repository.get_all()
-        return [TicketRead.model_validate(ticket) for ticket in db_tickets]
+        return ticket_list_adapter.validate_python(db_tickets)
 
     async def get_all_tickets_by_user(self, user_id: uuid.UUID) -> list[TicketRead]:
         """Get all tickets for a specific user.
 
+        The tickets are served from `ticket_list_cache` when possible,
+        a list is only cached once the user is known to exist.
+
         Args:
             user_id (uuid.UUID): The ID of the user whose tickets to retrieve.
 
@@ -141,24 +181,51 @@ class TicketService:
 
         Raises:
             HTTPException[status_code=404]: If the user is not found.
-            HTTPException[status_code=422]: If the user ID is not a valid UUID.
 
         """
 
-        if not is_valid_uuid(user_id):
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Invalid user ID",
-            )
+        tickets, _ = await self._get_user_ticket_list(user_id)
+        return list(tickets)
 
-        if not await self.user_repository.get(user_id):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found",
-            )
+    async def get_all_tickets_by_user_json(self, user_id: uuid.UUID) -> bytes:
+        """Get all tickets for a specific user rendered as a JSON array.
+
+        The rendered bytes are cached next to the list in `ticket_list_cache`, so serving the list skips serialization too.
+
+        Args:
+            user_id (uuid.UUID): The ID of the user whose tickets to retrieve.
+
+        Returns:
+            bytes: The JSON array of tickets for the specified user.
+
+        Raises:
+            HTTPException[status_code=404]: If the user is not found.
+
+        """
 
-        db_tickets = await self.ticket_repository.get_all_by_user(user_id)
-        return [TicketRead.model_validate(ticket) for ticket in db_tickets]
+        _, tickets_json = await self._get_user_ticket_list(user_id)
+        return tickets_json
+
+    async def _get_user_ticket_list(
+        self,
+        user_id: uuid.UUID,
+    ) -> tuple[list[TicketRead], bytes]:
+        entry = self.ticket_list_cache.get(user_id)
+        if entry is None:
+            generation = self.ticket_list_cache.generation
+            db_tickets = await self.ticket_repository.get_all_by_user(user_id)
+            # Only an empty result needs another query to tell a user without tickets from a missing one.
+            if not db_tickets and not await self.ticket_repository.user_exists(user_id):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="User not found",
+                )
+
+            tickets = ticket_list_adapter.validate_python(db_tickets)
+            entry = (tickets, ticket_list_adapter.dump_json(tickets))
+            self.ticket_list_cache.set(user_id, entry, generation)
+
+        return entry
 
     async def update_ticket(
         self,
@@ -177,31 +244,30 @@ class TicketService:
         Raises:
             HTTPException[status_code=404]: If the ticket is not found.
             HTTPException[status_code=404]: If the ticket status is not found.
-            HTTPException[status_code=422]: If the ticket ID is not a valid UUID.
 
         """
 
-        if not is_valid_uuid(ticket_id):
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Invalid ticket ID",
-            )
+        # An empty patch changes nothing, so there is no UPDATE to issue and no cache entry to invalidate.
+        if not ticket_update.model_fields_set:
+            return await self.get_ticket(ticket_id)
 
-        if not await self.ticket_repository.exists(ticket_id):
+        # The update itself reports a missing ticket (no row returned) or status (foreign key violation).
+        try:
+            db_ticket = await self.ticket_repository.update(ticket_id, ticket_update)
+        except NoResultFound:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Ticket not found",
             )
-
-        if ticket_update.status_id and not await self.ticket_status_repository.exists(
-            ticket_update.status_id
-        ):
+        except IntegrityError as exc:
+            if violated_constraint(exc) != TICKET_STATUS_FOREIGN_KEY:
+                raise
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Ticket status not found",
             )
 
-        db_ticket = await self.ticket_repository.update(ticket_id, ticket_update)
+        self._invalidate(self.ticket_list_cache, db_ticket.user_id)
         return TicketRead.model_validate(db_ticket)
 
     async def delete_ticket(self, ticket_id: uuid.UUID) -> None:
@@ -212,65 +278,71 @@ class TicketService:
 
         Raises:
             HTTPException[status_code=404]: If the ticket is not found.
-            HTTPException[status_code=422]: If the ticket ID is not a valid UUID.
 
         """
 
-        if not is_valid_uuid(ticket_id):
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Invalid ticket ID",
-            )
-
-        if not await self.ticket_repository.exists(ticket_id):
+        ticket_user_id = await self.ticket_repository.delete(ticket_id)
+        if ticket_user_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Ticket not found",
             )
 
-        await self.ticket_repository.delete(ticket_id)
+        self._invalidate(self.ticket_list_cache, ticket_user_id)
 
-    async def is_ticket_accessible(
+    async def check_ticket_access(
         self,
         ticket_id: uuid.UUID,
-        user_id: uuid.UUID,
-    ) -> bool:
-        """Check if a ticket is accessible by a user.
+        user: UserRead,
+    ) -> None:
+        """Check if a ticket is accessible by an already authenticated user.
 
-        It checks if both the ticket and user exist, and if the user is either the owner of the ticket or a superuser.
+        The user isn't fetched again, so the check is a single query for the ticket's owner.
 
         Args:
             ticket_id (uuid.UUID): The ID of the ticket to check.
-            user_id (uuid.UUID): The ID of the user to check.
-
-        Returns:
-            bool: True if the ticket is accessible by the user
+            user (UserRead): The user to check.
 
         Raises:
-            HTTPException[status_code=404]: If the ticket or user is not found.
+            HTTPException[status_code=404]: If the ticket is not found.
             HTTPException[status_code=403]: If the user does not have permission to access the ticket.
-            HTTPException[status_code=422]: If the ticket ID or user ID is not a valid UUID.
 
         """
 
-        if not is_valid_uuid(ticket_id):
+        ticket_user_id = await self.ticket_repository.get_user_id(ticket_id)
+        if ticket_user_id is None:
             raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Invalid ticket ID",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Ticket not found",
             )
 
-        if not is_valid_uuid(user_id):
+        if not user.is_superuser and ticket_user_id != user.id:
             raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Invalid user ID",
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You do not have permission to access this ticket.",
             )
 
-        user = await self.user_repository.get(user_id)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found",
-            )
+    async def get_ticket_for_user(
+        self,
+        ticket_id: uuid.UUID,
+        user: UserRead,
+    ) -> TicketRead:
+        """Get a ticket by ID if it is accessible by an already authenticated user.
+
+        The access check is done on the loaded ticket, so reading a ticket takes a single ticket query.
+
+        Args:
+            ticket_id (uuid.UUID): The ID of the ticket to retrieve.
+            user (UserRead): The user who requests the ticket.
+
+        Returns:
+            TicketRead: The ticket data.
+
+        Raises:
+            HTTPException[status_code=404]: If the ticket is not found.
+            HTTPException[status_code=403]: If the user does not have permission to access the ticket.
+
+        """
 
         db_ticket = await self.ticket_repository.get(ticket_id)
         if not db_ticket:
@@ -279,16 +351,13 @@ class TicketService:
                 detail="Ticket not found",
             )
 
-        if user.is_superuser:
-            return True
-
-        if db_ticket.user_id == user_id:
-            return True
+        if not user.is_superuser and db_ticket.user_id != user.id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You do not have permission to access this ticket.",
+            )
 
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have permission to access this ticket.",
-        )
+        return TicketRead.model_validate(db_ticket)
 
     async def create_ticket_status(
         self,
@@ -309,12 +378,15 @@ class TicketService:
             db_ticket_status = await self.ticket_status_repository.create(
                 ticket_status_create
             )
-        except IntegrityError:
+        except IntegrityError as exc:
+            if violated_constraint(exc) != TICKET_STATUS_NAME_UNIQUE:
+                raise
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Ticket status with this name already exists",
             )
 
+        self._invalidate(self.ticket_status_cache, *ALL_TICKET_STATUSES_KEYS)
         return TicketStatusRead.model_validate(db_ticket_status)
 
     async def get_ticket_status(
@@ -323,6 +395,8 @@ class TicketService:
     ) -> TicketStatusRead:
         """Get a ticket status by ID.
 
+        Ticket statuses are served from `ticket_status_cache` when possible.
+
         Args:
             ticket_status_id (uuid.UUID): The ID of the ticket status to retrieve.
 
@@ -331,36 +405,97 @@ class TicketService:
 
         Raises:
             HTTPException[status_code=404]: If the ticket status is not found.
-            HTTPException[status_code=422]: If the ticket status ID is not a valid UUID.
 
         """
 
-        if not is_valid_uuid(ticket_status_id):
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Invalid ticket status ID",
-            )
+        ticket_status = self.ticket_status_cache.get(ticket_status_id)
+        if ticket_status is not None:
+            return ticket_status
 
+        generation = self.ticket_status_cache.generation
         db_ticket_status = await self.ticket_status_repository.get(ticket_status_id)
         if not db_ticket_status:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Ticket status not found",
             )
-        return TicketStatusRead.model_validate(db_ticket_status)
+
+        ticket_status = TicketStatusRead.model_validate(db_ticket_status)
+        self.ticket_status_cache.set(ticket_status_id, ticket_status, generation)
+        return ticket_status
 
     async def get_all_ticket_statuses(self) -> list[TicketStatusRead]:
         """Get all ticket statuses.
 
+        Ticket statuses are served from `ticket_status_cache` when possible.
+
         Returns:
             list[TicketStatusRead]: A list of all ticket statuses.
 
         """
-        db_ticket_statuses = await self.ticket_status_repository.get_all()
-        return [
-            TicketStatusRead.model_validate(ticket_status)
-            for ticket_status in db_ticket_statuses
-        ]
+        ticket_statuses = self.ticket_status_cache.get(ALL_TICKET_STATUSES_KEY)
+        if ticket_statuses is None:
+            generation = self.ticket_status_cache.generation
+            db_ticket_statuses = await self.ticket_status_repository.get_all()
+            ticket_statuses = ticket_status_list_adapter.validate_python(
+                db_ticket_statuses,
+                from_attributes=True,
+            )
+            self.ticket_status_cache.set(
+                ALL_TICKET_STATUSES_KEY, ticket_statuses, generation
+            )
+
+        return list(ticket_statuses)
+
+    async def ticket_status_exists(self, ticket_status_id: uuid.UUID | None) -> bool:
+        """Check if a ticket status exists.
+
+        The IDs of all statuses are kept in `ticket_status_cache`, so the check doesn't query the database while the cache is warm.
+
+        Args:
+            ticket_status_id (uuid.UUID | None): The ID of the ticket status to check.
+
+        Returns:
+            bool: True if the ticket status exists, False otherwise.
+
+        """
+        ticket_status_ids = self.ticket_status_cache.get(ALL_TICKET_STATUS_IDS_KEY)
+        if ticket_status_ids is None:
+            generation = self.ticket_status_cache.generation
+            ticket_status_ids = frozenset(
+                ticket_status.id
+                for ticket_status in await self.get_all_ticket_statuses()
+            )
+            self.ticket_status_cache.set(
+                ALL_TICKET_STATUS_IDS_KEY, ticket_status_ids, generation
+            )
+
+        return ticket_status_id in ticket_status_ids
+
+    async def get_all_ticket_statuses_json(self) -> bytes:
+        """Get all ticket statuses rendered as a JSON array.
+
+        The rendered bytes are cached next to the list in `ticket_status_cache`, so serving the list skips serialization too.
+
+        Returns:
+            bytes: The JSON array of all ticket statuses.
+
+        """
+        ticket_statuses_json = self.ticket_status_cache.get(
+            ALL_TICKET_STATUSES_JSON_KEY
+        )
+        if ticket_statuses_json is None:
+            generation = self.ticket_status_cache.generation
+            ticket_statuses_json = ticket_status_list_adapter.dump_json(
+                await self.get_all_ticket_statuses()
+            )
+            self.ticket_status_cache.set(
+                ALL_TICKET_STATUSES_JSON_KEY,
+                ticket_statuses_json,
+                generation,
+            )
+
+        return ticket_statuses_json
 
     async def delete_ticket_status(
         self,
@@ -373,23 +508,20 @@ class TicketService:
 
         Raises:
             HTTPException[status_code=404]: If the ticket status is not found.
-            HTTPException[status_code=422]: If the ticket status ID is not a valid UUID.
 
         """
 
-        if not is_valid_uuid(ticket_status_id):
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Invalid ticket status ID",
-            )
-
-        if not await self.ticket_status_repository.exists(ticket_status_id):
+        if not await self.ticket_status_repository.delete(ticket_status_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Ticket status not found",
             )
 
-        await self.ticket_status_repository.delete(ticket_status_id)
+        self._invalidate(
+            self.ticket_status_cache, ticket_status_id, *ALL_TICKET_STATUSES_KEYS
+        )
+        # Tickets with this status now have no status, and they may belong to any user.
+        run_after_commit(self.ticket_repository.session, self.ticket_list_cache.clear)
 
     async def create_message(
         self,
@@ -407,17 +539,11 @@ class TicketService:
 
         Raises:
             HTTPException[status_code=404]: If the ticket is not found.
-            HTTPException[status_code=422]: If the ticket ID is not a valid UUID.
 
         """
 
-        if not is_valid_uuid(ticket_id):
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Invalid ticket ID",
-            )
-
-        if not await self.ticket_repository.exists(ticket_id):
+        ticket_user_id = await self.ticket_repository.get_user_id(ticket_id)
+        if ticket_user_id is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Ticket not found",
@@ -427,70 +553,5 @@ class TicketService:
             ticket_id,
             message_create,
         )
+        self._invalidate(self.ticket_list_cache, ticket_user_id)
         return MessageRead.model_validate(db_message)
-
-    async def get_ticket_messages(
-        self,
-        ticket_id: uuid.UUID,
-    ) -> list[MessageRead]:
-        """Get all messages for a ticket.
-
-        Args:
-            ticket_id (uuid.UUID): The ID of the ticket to retrieve messages for.
-
-        Returns:
-            list[MessageRead]: A list of messages for the specified ticket.
-
-        Raises:
-            HTTPException[status_code=404]: If the ticket is not found.
-            HTTPException[status_code=422]: If the ticket ID is not a valid UUID.
-
-        """
-
-        if not is_valid_uuid(ticket_id):
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Invalid ticket ID",
-            )
-
-        if not await self.ticket_repository.exists(ticket_id):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Ticket not found",
-            )
-
-        db_messages = await self.message_repository.get_all_by_ticket(ticket_id)
-        return [MessageRead.model_validate(message) for message in db_messages]
-
-    async def get_last_customer_message(
-        self,
-        ticket_id: uuid.UUID,
-    ) -> MessageRead | None:
-        """Get the last customer message for a ticket.
-
-        Args:
-            ticket_id (uuid.UUID): The ID of the ticket to retrieve the last customer message for.
-
-        Returns:
-            MessageRead | None: The last customer message for the specified ticket, or None if not found.
-
-        Raises:
-            HTTPException[status_code=404]: If the ticket is not found.
-            HTTPException[status_code=422]: If the ticket ID is not a valid UUID.
-
-        """
-
-        if not is_valid_uuid(ticket_id):
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail="Invalid ticket ID",
-            )
-
-        if not await self.ticket_repository.exists(ticket_id):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Ticket not found",
-            )
-
-        db_message = await self.message_repository.get_last_customer_message(ticket_id)
-        return MessageRead.model_validate(db_message) if db_message else None
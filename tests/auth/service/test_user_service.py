@@ -0,0 +1,50 @@
+import pytest
+from fastapi_users import InvalidPasswordException
+
+from ticket_api.auth.schemas import UserCreate
+from ticket_api.auth.service import UserService
+from ticket_api.config import settings
+
+USER_CREATE = UserCreate(email="test@example.com", password="Password123!")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestUserService:
+    @pytest.mark.parametrize(
+        "password",
+        [
+            "Password123!",
+            "Äbcdefg1!",
+            "Pass١٢٣word!",
+            "pÄsswörd1?",
+        ],
+    )
+    async def test_validate_password(self, user_service: UserService, password: str):
+        await user_service.validate_password(password, USER_CREATE)
+
+    @pytest.mark.parametrize(
+        "password, reason",
+        [
+            ("Pa1!", "Password must be at least 8 characters long."),
+            ("Password!", "Password must contain at least one digit."),
+            ("Pässwörd!", "Password must contain at least one digit."),
+            ("password1!", "Password must contain at least one uppercase letter."),
+            ("äbcdefg1!", "Password must contain at least one uppercase letter."),
+            ("PASSWORD1!", "Password must contain at least one lowercase letter."),
+            ("ÄBCDEFG1!", "Password must contain at least one lowercase letter."),
+            ("Password1", "Password must contain at least one special character."),
+            ("Password1§", "Password must contain at least one special character."),
+        ],
+    )
+    async def test_validate_password_invalid(
+        self, user_service: UserService, password: str, reason: str
+    ):
+        with pytest.raises(InvalidPasswordException) as exc_info:
+            await user_service.validate_password(password, USER_CREATE)
+        assert exc_info.value.reason == reason
+
+    async def test_validate_password_non_ascii_special_char(
+        self, user_service: UserService, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(settings, "PASSWORD_SPECIAL_CHARS", "!@#$%^&*?§")
+        await user_service.validate_password("Password1§", USER_CREATE)
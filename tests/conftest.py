@@ -1,20 +1,32 @@
+import asyncio
+import contextlib
+from typing import Iterator
+
 import pytest
 import pytest_asyncio
 from fastapi import HTTPException, Request, status
 from fastapi_users.db import SQLAlchemyUserDatabase
+from fastapi_users.password import PasswordHelper
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 from testcontainers.core.waiting_utils import wait_for_logs
 from testcontainers.postgres import PostgresContainer
 
 from ticket_api.api import app
 from ticket_api.auth.models import User
 from ticket_api.auth.router import get_current_active_superuser, get_current_active_user
-from ticket_api.auth.schemas import UserCreate, UserRead
+from ticket_api.auth.schemas import UserRead
 from ticket_api.auth.service import UserService
+from ticket_api.cache import TTLCache
 from ticket_api.db.base import DatabaseSessionManager
-from ticket_api.dependencies import get_async_session
-from ticket_api.tickets.dependencies import get_ai_service
+from ticket_api.dependencies import get_async_session, get_session_factory
+from ticket_api.tickets.dependencies import (
+    get_ai_service,
+    get_background_tasks,
+    get_ticket_list_cache,
+    get_ticket_status_cache,
+)
 
 
 @pytest.fixture(scope="session")
@@ -31,7 +43,7 @@ async def sessionmanager(test_db: PostgresContainer):
     await sessionmanager.close()
 
 
-@pytest_asyncio.fixture(scope="function", autouse=True)
+@pytest_asyncio.fixture(scope="session", autouse=True)
 async def create_tables(sessionmanager: DatabaseSessionManager):
     async with sessionmanager.connect() as connection:
         await sessionmanager.drop_all(connection)
@@ -39,15 +51,62 @@ async def create_tables(sessionmanager: DatabaseSessionManager):
         await connection.commit()
 
 
+def open_session(connection: AsyncConnection) -> AsyncSession:
+    # Commits only release a SAVEPOINT, the test's outer transaction is never committed.
+    return AsyncSession(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+
+
+@pytest_asyncio.fixture(scope="function")
+async def connection(
+    sessionmanager: DatabaseSessionManager,
+    create_tables: None,
+):
+    async with sessionmanager.connect() as connection:
+        transaction = await connection.begin()
+        yield connection
+        await transaction.rollback()
+
+
+@pytest.fixture
+def count_queries(connection: AsyncConnection):
+    """Collect the statements sent on the test's connection inside a `with` block."""
+
+    @contextlib.contextmanager
+    def count_queries() -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        sync_connection = connection.sync_connection
+        event.listen(sync_connection, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(
+                sync_connection, "before_cursor_execute", before_cursor_execute
+            )
+
+    return count_queries
+
+
 @pytest_asyncio.fixture(scope="function")
-async def async_session(sessionmanager: DatabaseSessionManager):
-    async with sessionmanager.session() as async_session:
+async def async_session(connection: AsyncConnection):
+    async with open_session(connection) as async_session:
         yield async_session
 
 
 @pytest_asyncio.fixture(scope="session")
 async def async_client():
-    return AsyncClient(transport=ASGITransport(app=app), base_url="http://testserver")
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://testserver",
+    ) as async_client:
+        yield async_client
 
 
 @pytest.fixture
@@ -60,54 +119,103 @@ def user_service(user_repository: SQLAlchemyUserDatabase):
     return UserService(user_repository)
 
 
-@pytest_asyncio.fixture
-async def user(user_service: UserService):
-    user_create = UserCreate(
-        email="test@example.com",
-        password="qQ123456!",
+@pytest.fixture(scope="session")
+def hashed_password() -> str:
+    # Argon2 is deliberately slow, so the fixture users share a hash computed once per session.
+    return PasswordHelper().hash("qQ123456!")
+
+
+async def insert_user(
+    async_session: AsyncSession,
+    email: str,
+    hashed_password: str,
+    is_superuser: bool = False,
+) -> User:
+    stmt = (
+        insert(User)
+        .values(
+            email=email,
+            hashed_password=hashed_password,
+            is_superuser=is_superuser,
+        )
+        .returning(User)
     )
-    user = await user_service.create(user_create)
+    user = (await async_session.execute(stmt)).scalar_one()
+    await async_session.commit()
     return user
 
 
 @pytest_asyncio.fixture
-async def superuser(user_service: UserService):
-    superuser_create = UserCreate(
-        email="superuser@example.com",
-        password="qQ123456!",
+async def user(async_session: AsyncSession, hashed_password: str):
+    return await insert_user(async_session, "test@example.com", hashed_password)
+
+
+@pytest_asyncio.fixture
+async def superuser(async_session: AsyncSession, hashed_password: str):
+    return await insert_user(
+        async_session,
+        "superuser@example.com",
+        hashed_password,
         is_superuser=True,
     )
-    superuser = await user_service.create(superuser_create)
-    return superuser
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def user_token():
     return "Bearer user_token"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def superuser_token():
     return "Bearer superuser_token"
 
 
+@pytest.fixture(scope="session")
+def user_headers(user_token: str) -> dict[str, str]:
+    return {"Authorization": user_token, "Content-Type": "application/json"}
+
+
+@pytest.fixture(scope="session")
+def superuser_headers(superuser_token: str) -> dict[str, str]:
+    return {"Authorization": superuser_token, "Content-Type": "application/json"}
+
+
 @pytest.fixture
 def ai_response():
     return "Mock AI response."
 
 
+@pytest.fixture
+def background_tasks() -> set[asyncio.Task]:
+    return set()
+
+
 @pytest_asyncio.fixture(scope="function", autouse=True)
 async def dependency_overrides(
-    sessionmanager: DatabaseSessionManager,
+    connection: AsyncConnection,
     user: UserRead,
     superuser: UserRead,
     user_token: str,
     superuser_token: str,
     ai_response: str,
+    background_tasks: set[asyncio.Task],
 ):
     async def get_async_session_override():
-        async with sessionmanager.session() as async_session:
-            yield async_session
+        async with open_session(connection) as async_session:
+            try:
+                yield async_session
+            except Exception:
+                await async_session.rollback()
+                raise
+
+    @contextlib.asynccontextmanager
+    async def session_factory_override():
+        async with open_session(connection) as async_session:
+            try:
+                yield async_session
+            except Exception:
+                await async_session.rollback()
+                raise
 
     async def get_current_active_user_override(request: Request):
         token = request.headers.get("Authorization")
@@ -164,8 +272,17 @@ async def dependency_overrides(
         return MockAIService()
 
     app.dependency_overrides[get_async_session] = get_async_session_override
+    app.dependency_overrides[get_session_factory] = lambda: session_factory_override
     app.dependency_overrides[get_current_active_user] = get_current_active_user_override
     app.dependency_overrides[get_current_active_superuser] = (
         get_current_active_superuser_override
     )
     app.dependency_overrides[get_ai_service] = get_ai_service_override
+
+    ticket_status_cache = TTLCache(ttl=60)
+    app.dependency_overrides[get_ticket_status_cache] = lambda: ticket_status_cache
+
+    ticket_list_cache = TTLCache(ttl=60)
+    app.dependency_overrides[get_ticket_list_cache] = lambda: ticket_list_cache
+
+    app.dependency_overrides[get_background_tasks] = lambda: background_tasks
@@ -0,0 +1,88 @@
+from ticket_api.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get(self):
+        cache = TTLCache(ttl=60)
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+    def test_get_missing(self):
+        cache = TTLCache(ttl=60)
+        assert cache.get("key") is None
+        assert cache.get("key", "default") == "default"
+
+    def test_get_expired(self):
+        cache = TTLCache(ttl=0)
+        cache.set("key", "value")
+        assert cache.get("key", "default") == "default"
+        assert "key" not in cache._entries
+
+    def test_maxsize_evicts_oldest(self):
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("first", 1)
+        cache.set("second", 2)
+        cache.set("third", 3)
+        assert cache.get("first") is None
+        assert cache.get("second") == 2
+        assert cache.get("third") == 3
+
+    def test_maxsize_set_existing_key_moves_it_last(self):
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("first", 1)
+        cache.set("second", 2)
+        cache.set("first", 10)
+        cache.set("third", 3)
+        assert cache.get("first") == 10
+        assert cache.get("second") is None
+        assert cache.get("third") == 3
+
+    def test_delete(self):
+        cache = TTLCache(ttl=60)
+        cache.set("first", 1)
+        cache.set("second", 2)
+        cache.delete("first", "missing")
+        assert cache.get("first") is None
+        assert cache.get("second") == 2
+
+    def test_clear(self):
+        cache = TTLCache(ttl=60)
+        cache.set("first", 1)
+        cache.set("second", 2)
+        cache.clear()
+        assert cache.get("first") is None
+        assert cache.get("second") is None
+
+    def test_set_skipped_after_delete(self):
+        cache = TTLCache(ttl=60)
+        generation = cache.generation
+        # The key is invalidated between reading the data and storing it.
+        cache.delete("key")
+        cache.set("key", "stale", generation)
+        assert cache.get("key") is None
+
+        cache.set("key", "fresh", cache.generation)
+        assert cache.get("key") == "fresh"
+
+    def test_set_kept_after_delete_of_other_key(self):
+        cache = TTLCache(ttl=60)
+        generation = cache.generation
+        cache.delete("other")
+        cache.set("key", "value", generation)
+        assert cache.get("key") == "value"
+
+    def test_set_skipped_after_clear(self):
+        cache = TTLCache(ttl=60)
+        generation = cache.generation
+        cache.clear()
+        cache.set("key", "stale", generation)
+        assert cache.get("key") is None
+
+    def test_set_skipped_after_pruned_delete(self):
+        cache = TTLCache(ttl=60, maxsize=1)
+        generation = cache.generation
+        cache.delete("key")
+        # Only one invalidation is remembered, the one of "key" is folded into the floor.
+        cache.delete("other")
+        cache.set("key", "stale", generation)
+        assert cache.get("key") is None
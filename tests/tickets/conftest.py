@@ -1,9 +1,9 @@
 import pytest
 import pytest_asyncio
-from fastapi_users.db import SQLAlchemyUserDatabase
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ticket_api.auth.schemas import UserRead
+from ticket_api.cache import TTLCache
 from ticket_api.tickets.repository import (
     MessageRepository,
     TicketRepository,
@@ -34,18 +34,30 @@ def message_repository(async_session: AsyncSession) -> MessageRepository:
     return MessageRepository(async_session)
 
 
+@pytest.fixture
+def ticket_status_cache() -> TTLCache:
+    return TTLCache(ttl=60)
+
+
+@pytest.fixture
+def ticket_list_cache() -> TTLCache:
+    return TTLCache(ttl=60)
+
+
 @pytest.fixture
 def ticket_service(
     ticket_repository: TicketRepository,
     ticket_status_repository: TicketStatusRepository,
     message_repository: MessageRepository,
-    user_repository: SQLAlchemyUserDatabase,
+    ticket_status_cache: TTLCache,
+    ticket_list_cache: TTLCache,
 ) -> TicketService:
     return TicketService(
         ticket_repository=ticket_repository,
         ticket_status_repository=ticket_status_repository,
         message_repository=message_repository,
-        user_repository=user_repository,
+        ticket_status_cache=ticket_status_cache,
+        ticket_list_cache=ticket_list_cache,
     )
 
 
@@ -55,6 +67,7 @@ async def ticket_status(ticket_service: TicketService):
         name="Open",
     )
     ticket_status = await ticket_service.create_ticket_status(ticket_status_create)
+    await ticket_service.commit()
     return ticket_status
 
 
@@ -71,6 +84,7 @@ async def ticket(
         status_id=ticket_status.id,
     )
     ticket = await ticket_service.create_ticket(ticket_create)
+    await ticket_service.commit()
     return ticket
 
 
@@ -87,6 +101,7 @@ async def superuser_ticket(
         status_id=ticket_status.id,
     )
     ticket = await ticket_service.create_ticket(ticket_create)
+    await ticket_service.commit()
     return ticket
 
 
@@ -102,6 +117,7 @@ async def message(
         ticket.id,
         message_create,
     )
+    await ticket_service.commit()
     return message
 
 
@@ -118,4 +134,5 @@ async def ai_message(
         ticket.id,
         message_create,
     )
+    await ticket_service.commit()
     return message
@@ -114,9 +114,11 @@ class TestMessageRepository:
         assert isinstance(messages, list)
         assert all(isinstance(m, Message) for m in messages)
         assert all(m.ticket_id == ticket.id for m in messages)
-        assert any(m.id == message.id for m in messages)
-        assert any(m.content == message.content for m in messages)
-        assert any(m.created_at == message.created_at for m in messages)
+        message_from_db = next(m for m in messages if m.id == message.id)
+        assert (message_from_db.content, message_from_db.created_at) == (
+            message.content,
+            message.created_at,
+        )
 
         # Validate sorting by created_at
         assert messages == sorted(messages, key=lambda m: m.created_at)
@@ -5,8 +5,10 @@ import pytest
 
 from ticket_api.auth.schemas import UserRead
 from ticket_api.tickets.models import Ticket
-from ticket_api.tickets.repository import TicketRepository
+from ticket_api.tickets.repository import MessageRepository, TicketRepository
 from ticket_api.tickets.schemas import (
+    MessageCreate,
+    MessageRead,
     TicketCreate,
     TicketRead,
     TicketStatusRead,
@@ -39,51 +41,35 @@ class TestTicketRepository:
         assert ticket.status_id == ticket_create.status_id
         assert ticket.created_at is not None
 
-    async def test_create_with_invalid_user(
-        self,
-        ticket_repository: TicketRepository,
-        ticket_status: TicketStatusRead,
-    ):
-        ticket_create = TicketCreate(
-            title="Test Ticket",
-            description="This is a test ticket.",
-            user_id=uuid.uuid4(),  # Invalid user ID
-            status_id=ticket_status.id,
-        )
-
-        with pytest.raises(IntegrityError):
-            await ticket_repository.create(ticket_create)
-
-    async def test_create_with_invalid_status(
+    @pytest.mark.parametrize("missing", ["user_id", "status_id"])
+    async def test_create_with_missing_reference(
         self,
         ticket_repository: TicketRepository,
         user: UserRead,
+        ticket_status: TicketStatusRead,
+        missing: str,
     ):
-        ticket_create = TicketCreate(
-            title="Test Ticket",
-            description="This is a test ticket.",
-            user_id=user.id,
-            status_id=uuid.uuid4(),  # Invalid status ID
-        )
+        ticket_data = {
+            "title": "Test Ticket",
+            "description": "This is a test ticket.",
+            "user_id": user.id,
+            "status_id": ticket_status.id,
+            missing: uuid.uuid4(),
+        }
 
         with pytest.raises(IntegrityError):
-            await ticket_repository.create(ticket_create)
+            await ticket_repository.create(TicketCreate(**ticket_data))
 
-    async def test_create_with_user_not_uuid(
-        self,
-        ticket_repository: TicketRepository,
-        ticket_status: TicketStatusRead,
-    ):
+    async def test_create_with_user_not_uuid(self):
+        # Rejected by the schema before any statement is built.
         with pytest.raises(ValidationError):
-            ticket_create = TicketCreate(
+            TicketCreate(
                 title="Test Ticket",
                 description="This is a test ticket.",
-                user_id="not-a-uuid",  # Invalid user ID
-                status_id=ticket_status.id,
+                user_id="not-a-uuid",
+                status_id=uuid.uuid4(),
             )
 
-            await ticket_repository.create(ticket_create)
-
     async def test_exists(
         self,
         ticket_repository: TicketRepository,
@@ -99,12 +85,13 @@ class TestTicketRepository:
         exists = await ticket_repository.exists(uuid.uuid4())
         assert exists is False
 
-    async def test_exists_not_uuid(
+    async def test_user_exists(
         self,
         ticket_repository: TicketRepository,
+        user: UserRead,
     ):
-        with pytest.raises(DBAPIError):
-            await ticket_repository.exists("not-a-uuid")
+        assert await ticket_repository.user_exists(user.id) is True
+        assert await ticket_repository.user_exists(uuid.uuid4()) is False
 
     async def test_get(
         self,
@@ -127,28 +114,20 @@ class TestTicketRepository:
         ticket_from_db = await ticket_repository.get(uuid.uuid4())
         assert ticket_from_db is None
 
-    async def test_get_not_uuid(
+    async def test_get_user_id(
         self,
         ticket_repository: TicketRepository,
+        ticket: TicketRead,
     ):
-        with pytest.raises(DBAPIError):
-            await ticket_repository.get("not-a-uuid")
+        user_id = await ticket_repository.get_user_id(ticket.id)
+        assert user_id == ticket.user_id
 
-    async def test_get_all(
+    async def test_get_user_id_not_found(
         self,
         ticket_repository: TicketRepository,
-        ticket: TicketRead,
     ):
-        tickets = await ticket_repository.get_all()
-        assert isinstance(tickets, list)
-        assert len(tickets) > 0
-        assert all(isinstance(t, Ticket) for t in tickets)
-        assert any(t.id == ticket.id for t in tickets)
-        assert any(t.title == ticket.title for t in tickets)
-        assert any(t.description == ticket.description for t in tickets)
-        assert any(t.user_id == ticket.user_id for t in tickets)
-        assert any(t.status_id == ticket.status_id for t in tickets)
-        assert any(t.created_at == ticket.created_at for t in tickets)
+        user_id = await ticket_repository.get_user_id(uuid.uuid4())
+        assert user_id is None
 
     async def test_get_all_empty(
         self,
@@ -158,23 +137,6 @@ class TestTicketRepository:
         assert isinstance(tickets, list)
         assert len(tickets) == 0
 
-    async def test_get_all_by_user(
-        self,
-        ticket_repository: TicketRepository,
-        ticket: TicketRead,
-        user: UserRead,
-    ):
-        tickets = await ticket_repository.get_all_by_user(user.id)
-        assert isinstance(tickets, list)
-        assert len(tickets) > 0
-        assert all(isinstance(t, Ticket) for t in tickets)
-        assert any(t.id == ticket.id for t in tickets)
-        assert any(t.title == ticket.title for t in tickets)
-        assert any(t.description == ticket.description for t in tickets)
-        assert any(t.user_id == ticket.user_id for t in tickets)
-        assert any(t.status_id == ticket.status_id for t in tickets)
-        assert any(t.created_at == ticket.created_at for t in tickets)
-
     async def test_get_all_by_user_empty(
         self,
         ticket_repository: TicketRepository,
@@ -192,48 +154,92 @@ class TestTicketRepository:
         assert isinstance(tickets, list)
         assert len(tickets) == 0
 
-    async def test_get_all_by_user_not_uuid(
+    async def test_get_all(
         self,
         ticket_repository: TicketRepository,
+        ticket: TicketRead,
     ):
-        with pytest.raises(DBAPIError):
-            await ticket_repository.get_all_by_user("not-a-uuid")
+        tickets = await ticket_repository.get_all()
+        assert isinstance(tickets, list)
+        assert [TicketRead.model_validate(t) for t in tickets] == [ticket]
 
-    async def test_update(
+    async def test_get_all_by_user(
         self,
         ticket_repository: TicketRepository,
         ticket: TicketRead,
+        message: MessageRead,
+        user: UserRead,
     ):
-        ticket_update = TicketUpdate(
-            title="Updated Title",
-            description="Updated description.",
-        )
-
-        updated_ticket = await ticket_repository.update(ticket.id, ticket_update)
-        assert updated_ticket is not None
-        assert isinstance(updated_ticket, Ticket)
-        assert updated_ticket.id == ticket.id
-        assert updated_ticket.title == "Updated Title"
-        assert updated_ticket.description == "Updated description."
-        assert updated_ticket.user_id == ticket.user_id
-
-    async def test_update_only_one_field(
+        tickets = await ticket_repository.get_all_by_user(user.id)
+        assert isinstance(tickets, list)
+        assert len(tickets) == 1
+        assert all(isinstance(t, dict) for t in tickets)
+
+        projected = TicketRead.model_validate(tickets[0])
+        assert projected.id == ticket.id
+        assert projected.status == ticket.status
+        assert projected.messages == [message]
+
+    @pytest.mark.parametrize(
+        "method",
+        ["get_all", "get_all_by_user"],
+    )
+    async def test_get_all_query_count(
+        self,
+        ticket_repository: TicketRepository,
+        message_repository: MessageRepository,
+        ticket_status: TicketStatusRead,
+        user: UserRead,
+        count_queries,
+        method: str,
+    ):
+        for title in ("First", "Second", "Third"):
+            db_ticket = await ticket_repository.create(
+                TicketCreate(title=title, user_id=user.id, status_id=ticket_status.id)
+            )
+            await message_repository.create(
+                db_ticket.id, MessageCreate(content="Test message")
+            )
+        args = (user.id,) if method.endswith("_by_user") else ()
+
+        # One query for the tickets and their statuses, one for all of their messages.
+        with count_queries() as statements:
+            tickets = await getattr(ticket_repository, method)(*args)
+
+        assert len(tickets) == 3
+        assert len(statements) == 2
+
+    @pytest.mark.parametrize(
+        "update_data",
+        [
+            {"title": "Updated Title", "description": "Updated description."},
+            {"title": "Updated Title"},
+        ],
+    )
+    async def test_update(
         self,
         ticket_repository: TicketRepository,
         ticket: TicketRead,
+        update_data: dict,
     ):
-        ticket_update = TicketUpdate(
-            title="Updated Title",
-        )
+        ticket_update = TicketUpdate(**update_data)
+        # Fields left out of the patch keep their values.
+        expected = {
+            "title": ticket.title,
+            "description": ticket.description,
+            "status_id": ticket.status_id,
+            **update_data,
+        }
 
         updated_ticket = await ticket_repository.update(ticket.id, ticket_update)
-        assert updated_ticket is not None
         assert isinstance(updated_ticket, Ticket)
         assert updated_ticket.id == ticket.id
-        assert updated_ticket.title == "Updated Title"
-        assert updated_ticket.description == ticket.description
         assert updated_ticket.user_id == ticket.user_id
-        assert updated_ticket.status_id == ticket.status_id
+        assert {
+            "title": updated_ticket.title,
+            "description": updated_ticket.description,
+            "status_id": updated_ticket.status_id,
+        } == expected
 
     async def test_update_not_found(
         self,
@@ -247,24 +253,12 @@ class TestTicketRepository:
         with pytest.raises(NoResultFound):
             await ticket_repository.update(uuid.uuid4(), ticket_update)
 
-    async def test_update_not_uuid(
-        self,
-        ticket_repository: TicketRepository,
-    ):
-        ticket_update = TicketUpdate(
-            title="Updated Title",
-            description="Updated description.",
-        )
-
-        with pytest.raises(DBAPIError):
-            await ticket_repository.update("not-a-uuid", ticket_update)
-
     async def test_delete(
         self,
         ticket_repository: TicketRepository,
         ticket: TicketRead,
     ):
-        await ticket_repository.delete(ticket.id)
+        assert await ticket_repository.delete(ticket.id) == ticket.user_id
         ticket_from_db = await ticket_repository.get(ticket.id)
         assert ticket_from_db is None
 
@@ -272,11 +266,31 @@ class TestTicketRepository:
         self,
         ticket_repository: TicketRepository,
     ):
-        await ticket_repository.delete(uuid.uuid4())
-
-    async def test_delete_not_uuid(
+        assert await ticket_repository.delete(uuid.uuid4()) is None
+
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("exists", ()),
+            ("get", ()),
+            ("get_all_by_user", ()),
+            (
+                "update",
+                (
+                    TicketUpdate(
+                        title="Updated Title",
+                        description="Updated description.",
+                    ),
+                ),
+            ),
+            ("delete", ()),
+        ],
+    )
+    async def test_not_uuid(
         self,
         ticket_repository: TicketRepository,
+        method: str,
+        args: tuple,
     ):
         with pytest.raises(DBAPIError):
-            await ticket_repository.delete("not-a-uuid")
+            await getattr(ticket_repository, method)("not-a-uuid", *args)
@@ -48,13 +48,6 @@ class TestTicketStatusRepository:
         exists = await ticket_status_repository.exists(uuid.uuid4())
         assert exists is False
 
-    async def test_exists_not_uuid(
-        self,
-        ticket_status_repository: TicketStatusRepository,
-    ):
-        with pytest.raises(DBAPIError):
-            await ticket_status_repository.exists("not-a-uuid")
-
     async def test_get(
         self,
         ticket_status_repository: TicketStatusRepository,
@@ -72,13 +65,6 @@ class TestTicketStatusRepository:
         ticket_status_from_db = await ticket_status_repository.get(uuid.uuid4())
         assert ticket_status_from_db is None
 
-    async def test_get_not_uuid(
-        self,
-        ticket_status_repository: TicketStatusRepository,
-    ):
-        with pytest.raises(DBAPIError):
-            await ticket_status_repository.get("not-a-uuid")
-
     async def test_get_all(
         self,
         ticket_status_repository: TicketStatusRepository,
@@ -88,8 +74,10 @@ class TestTicketStatusRepository:
         assert isinstance(ticket_statuses, list)
         assert len(ticket_statuses) > 0
         assert all(isinstance(ts, TicketStatus) for ts in ticket_statuses)
-        assert any(ts.id == ticket_status.id for ts in ticket_statuses)
-        assert any(ts.name == ticket_status.name for ts in ticket_statuses)
+        ticket_status_from_db = next(
+            ts for ts in ticket_statuses if ts.id == ticket_status.id
+        )
+        assert ticket_status_from_db.name == ticket_status.name
 
     async def test_get_all_empty(
         self,
@@ -104,7 +92,7 @@ class TestTicketStatusRepository:
         ticket_status_repository: TicketStatusRepository,
         ticket_status: TicketStatusRead,
     ):
-        await ticket_status_repository.delete(ticket_status.id)
+        assert await ticket_status_repository.delete(ticket_status.id) is True
         ticket_status_from_db = await ticket_status_repository.get(ticket_status.id)
         assert ticket_status_from_db is None
 
@@ -112,11 +100,13 @@ class TestTicketStatusRepository:
         self,
         ticket_status_repository: TicketStatusRepository,
     ):
-        await ticket_status_repository.delete(uuid.uuid4())
+        assert await ticket_status_repository.delete(uuid.uuid4()) is False
 
-    async def test_delete_not_uuid(
+    @pytest.mark.parametrize("method", ["exists", "get", "delete"])
+    async def test_not_uuid(
         self,
         ticket_status_repository: TicketStatusRepository,
+        method: str,
     ):
         with pytest.raises(DBAPIError):
-            await ticket_status_repository.delete("not-a-uuid")
+            await getattr(ticket_status_repository, method)("not-a-uuid")
@@ -1,7 +1,11 @@
+import contextlib
+import itertools
 import uuid
+from typing import Iterator
 import pytest
 
 from ticket_api.auth.schemas import UserRead
+from ticket_api.tickets.repository import TicketRepository, TicketStatusRepository
 from ticket_api.tickets.schemas import (
     MessageCreate,
     MessageRead,
@@ -10,11 +14,25 @@ from ticket_api.tickets.schemas import (
     TicketStatusCreate,
     TicketStatusRead,
     TicketUpdate,
+    ticket_list_adapter,
+    ticket_status_list_adapter,
 )
-from ticket_api.tickets.service import TicketService
+from ticket_api.tickets.service import ALL_TICKET_STATUSES_KEYS, TicketService
 from fastapi import HTTPException, status
 
 
+@contextlib.contextmanager
+def assert_http_error(status_code: int, detail: str | None = None) -> Iterator[None]:
+    """Expect the block to raise an `HTTPException` with the given status code and, if set, detail."""
+
+    with pytest.raises(HTTPException) as excinfo:
+        yield
+
+    assert excinfo.value.status_code == status_code
+    if detail is not None:
+        assert excinfo.value.detail == detail
+
+
 @pytest.mark.asyncio(loop_scope="session")
 class TestTicketService:
     async def test_create_ticket_status(
@@ -38,11 +56,9 @@ class TestTicketService:
         ticket_status_create = TicketStatusCreate(
             name=ticket_status.name,
         )
-        with pytest.raises(HTTPException) as excinfo:
+        with assert_http_error(status.HTTP_409_CONFLICT):
             await ticket_service.create_ticket_status(ticket_status_create)
 
-        assert excinfo.value.status_code == status.HTTP_409_CONFLICT
-
     async def test_get_ticket_status(
         self,
         ticket_service: TicketService,
@@ -58,20 +74,9 @@ class TestTicketService:
         self,
         ticket_service: TicketService,
     ):
-        with pytest.raises(HTTPException) as excinfo:
+        with assert_http_error(status.HTTP_404_NOT_FOUND):
             await ticket_service.get_ticket_status(uuid.uuid4())
 
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
-
-    async def test_get_ticket_status_not_uuid(
-        self,
-        ticket_service: TicketService,
-    ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.get_ticket_status("not-a-uuid")
-
-        assert excinfo.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
     async def test_get_all_ticket_statuses(
         self,
         ticket_service: TicketService,
@@ -82,8 +87,10 @@ class TestTicketService:
         assert isinstance(ticket_statuses, list)
         assert len(ticket_statuses) > 0
         assert all(isinstance(ts, TicketStatusRead) for ts in ticket_statuses)
-        assert any(ts.id == ticket_status.id for ts in ticket_statuses)
-        assert any(ts.name == ticket_status.name for ts in ticket_statuses)
+
+        ticket_statuses_by_id = {ts.id: ts for ts in ticket_statuses}
+        assert ticket_status.id in ticket_statuses_by_id
+        assert ticket_statuses_by_id[ticket_status.id].name == ticket_status.name
 
     async def test_get_all_ticket_statuses_empty(
         self,
@@ -94,34 +101,155 @@ class TestTicketService:
         assert isinstance(ticket_statuses, list)
         assert len(ticket_statuses) == 0
 
-    async def test_delete_ticket_status(
+    async def test_get_all_ticket_statuses_cached(
+        self,
+        ticket_service: TicketService,
+        ticket_status_repository: TicketStatusRepository,
+    ):
+        assert await ticket_service.get_all_ticket_statuses() == []
+
+        await ticket_status_repository.create(TicketStatusCreate(name="Hidden"))
+        assert await ticket_service.get_all_ticket_statuses() == []
+
+        ticket_status = await ticket_service.create_ticket_status(
+            TicketStatusCreate(name="Open")
+        )
+        await ticket_service.commit()
+        ticket_statuses = await ticket_service.get_all_ticket_statuses()
+        assert len(ticket_statuses) == 2
+        assert ticket_status in ticket_statuses
+
+    async def test_cached_reads_skip_queries(
+        self,
+        ticket_service: TicketService,
+        ticket: TicketRead,
+        ticket_status: TicketStatusRead,
+        user: UserRead,
+        count_queries,
+    ):
+        reads = (
+            lambda: ticket_service.get_ticket_status(ticket_status.id),
+            ticket_service.get_all_ticket_statuses,
+            lambda: ticket_service.ticket_status_exists(ticket_status.id),
+            lambda: ticket_service.get_all_tickets_by_user(user.id),
+        )
+        expected = [await read() for read in reads]
+
+        with count_queries() as statements:
+            assert [await read() for read in reads] == expected
+
+        assert statements == []
+
+    async def test_ticket_status_exists(
         self,
         ticket_service: TicketService,
         ticket_status: TicketStatusRead,
     ):
+        assert await ticket_service.ticket_status_exists(ticket_status.id) is True
+        assert await ticket_service.ticket_status_exists(uuid.uuid4()) is False
+        assert await ticket_service.ticket_status_exists(None) is False
+
         await ticket_service.delete_ticket_status(ticket_status.id)
-        with pytest.raises(HTTPException) as excinfo:
+        await ticket_service.commit()
+        assert await ticket_service.ticket_status_exists(ticket_status.id) is False
+
+    async def test_get_all_ticket_statuses_json(
+        self,
+        ticket_service: TicketService,
+        ticket_status: TicketStatusRead,
+    ):
+        ticket_statuses_json = await ticket_service.get_all_ticket_statuses_json()
+        ticket_statuses = ticket_status_list_adapter.validate_json(ticket_statuses_json)
+        assert ticket_statuses == [ticket_status]
+        cached_json = await ticket_service.get_all_ticket_statuses_json()
+        assert cached_json is ticket_statuses_json
+
+        await ticket_service.delete_ticket_status(ticket_status.id)
+        await ticket_service.commit()
+        assert await ticket_service.get_all_ticket_statuses_json() == b"[]"
+
+    async def test_delete_ticket_status_invalidates_cache(
+        self,
+        ticket_service: TicketService,
+        ticket_status: TicketStatusRead,
+    ):
+        assert await ticket_service.get_ticket_status(ticket_status.id) == ticket_status
+        assert await ticket_service.get_all_ticket_statuses() == [ticket_status]
+
+        await ticket_service.delete_ticket_status(ticket_status.id)
+        assert await ticket_service.get_all_ticket_statuses() == [ticket_status]
+
+        await ticket_service.commit()
+        assert await ticket_service.get_all_ticket_statuses() == []
+        with assert_http_error(status.HTTP_404_NOT_FOUND):
             await ticket_service.get_ticket_status(ticket_status.id)
 
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
+    async def test_get_ticket_status_invalidated_during_fill(
+        self,
+        ticket_service: TicketService,
+        ticket_status: TicketStatusRead,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        get = ticket_service.ticket_status_repository.get
+
+        async def get_then_invalidate(ticket_status_id: uuid.UUID):
+            db_ticket_status = await get(ticket_status_id)
+            # A concurrent write commits and invalidates the status while this read is in flight.
+            ticket_service.ticket_status_cache.delete(ticket_status_id)
+            return db_ticket_status
 
-    async def test_delete_ticket_status_not_found(
+        monkeypatch.setattr(
+            ticket_service.ticket_status_repository, "get", get_then_invalidate
+        )
+        assert await ticket_service.get_ticket_status(ticket_status.id) == ticket_status
+        assert ticket_service.ticket_status_cache.get(ticket_status.id) is None
+
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("get_all_ticket_statuses", ()),
+            ("get_all_ticket_statuses_json", ()),
+            ("ticket_status_exists", (uuid.uuid4(),)),
+        ],
+    )
+    async def test_ticket_status_list_invalidated_during_fill(
         self,
         ticket_service: TicketService,
+        ticket_status: TicketStatusRead,
+        monkeypatch: pytest.MonkeyPatch,
+        method: str,
+        args: tuple,
     ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.delete_ticket_status(uuid.uuid4())
+        get_all = ticket_service.ticket_status_repository.get_all
 
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
+        async def get_all_then_invalidate():
+            db_ticket_statuses = await get_all()
+            # A concurrent write commits and invalidates the list while this read is in flight.
+            ticket_service.ticket_status_cache.delete(*ALL_TICKET_STATUSES_KEYS)
+            return db_ticket_statuses
 
-    async def test_delete_ticket_status_not_uuid(
+        monkeypatch.setattr(
+            ticket_service.ticket_status_repository, "get_all", get_all_then_invalidate
+        )
+        await getattr(ticket_service, method)(*args)
+        for key in ALL_TICKET_STATUSES_KEYS:
+            assert ticket_service.ticket_status_cache.get(key) is None
+
+    async def test_delete_ticket_status(
         self,
         ticket_service: TicketService,
+        ticket_status: TicketStatusRead,
     ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.delete_ticket_status("not-a-uuid")
+        await ticket_service.delete_ticket_status(ticket_status.id)
+        with assert_http_error(status.HTTP_404_NOT_FOUND):
+            await ticket_service.get_ticket_status(ticket_status.id)
 
-        assert excinfo.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    async def test_delete_ticket_status_not_found(
+        self,
+        ticket_service: TicketService,
+    ):
+        with assert_http_error(status.HTTP_404_NOT_FOUND):
+            await ticket_service.delete_ticket_status(uuid.uuid4())
 
     async def test_create_ticket(
         self,
@@ -145,6 +273,29 @@ class TestTicketService:
         assert ticket.status_id == ticket_status.id
         assert ticket.created_at is not None
 
+    async def test_create_ticket_query_count(
+        self,
+        ticket_service: TicketService,
+        user: UserRead,
+        ticket_status: TicketStatusRead,
+        count_queries,
+    ):
+        # Warm the status cache, so only the insert itself is counted.
+        assert await ticket_service.ticket_status_exists(ticket_status.id) is True
+        ticket_create = TicketCreate(
+            title="Test Ticket",
+            user_id=user.id,
+            status_id=ticket_status.id,
+        )
+
+        # The INSERT ... RETURNING and one query for the status, a new ticket has no messages to load.
+        with count_queries() as statements:
+            ticket = await ticket_service.create_ticket(ticket_create)
+
+        assert len(statements) == 2
+        assert ticket.status.id == ticket_status.id
+        assert ticket.messages == []
+
     async def test_create_ticket_invalid_user(
         self,
         ticket_service: TicketService,
@@ -156,12 +307,9 @@ class TestTicketService:
             user_id=uuid.uuid4(),  # Invalid user ID
             status_id=ticket_status.id,
         )
-        with pytest.raises(HTTPException) as excinfo:
+        with assert_http_error(status.HTTP_404_NOT_FOUND, "User not found"):
             await ticket_service.create_ticket(ticket_create)
 
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
-        assert excinfo.value.detail == "User not found"
-
     async def test_create_ticket_invalid_status(
         self,
         ticket_service: TicketService,
@@ -173,11 +321,27 @@ class TestTicketService:
             user_id=user.id,
             status_id=uuid.uuid4(),  # Invalid status ID
         )
-        with pytest.raises(HTTPException) as excinfo:
+        with assert_http_error(status.HTTP_404_NOT_FOUND, "Ticket status not found"):
             await ticket_service.create_ticket(ticket_create)
 
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
-        assert excinfo.value.detail == "Ticket status not found"
+    async def test_create_ticket_status_deleted(
+        self,
+        ticket_service: TicketService,
+        ticket_status_repository: TicketStatusRepository,
+        ticket_status: TicketStatusRead,
+        user: UserRead,
+    ):
+        # Warm the cache, then delete the status behind the service's back.
+        assert await ticket_service.ticket_status_exists(ticket_status.id) is True
+        await ticket_status_repository.delete(ticket_status.id)
+
+        ticket_create = TicketCreate(
+            title="Test Ticket",
+            user_id=user.id,
+            status_id=ticket_status.id,
+        )
+        with assert_http_error(status.HTTP_404_NOT_FOUND, "Ticket status not found"):
+            await ticket_service.create_ticket(ticket_create)
 
     async def test_get_ticket(
         self,
@@ -194,24 +358,31 @@ class TestTicketService:
         assert ticket_read.status_id == ticket.status_id
         assert ticket_read.created_at == ticket.created_at
 
-    async def test_get_ticket_not_found(
-        self,
-        ticket_service: TicketService,
-    ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.get_ticket(uuid.uuid4())
-
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
-        assert excinfo.value.detail == "Ticket not found"
-
-    async def test_get_ticket_not_uuid(
-        self,
-        ticket_service: TicketService,
-    ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.get_ticket("not-a-uuid")
-
-        assert excinfo.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    @pytest.mark.parametrize(
+        "method, args",
+        [
+            ("get_ticket", ()),
+            (
+                "update_ticket",
+                (
+                    TicketUpdate(
+                        title="Updated Test Ticket",
+                        description="This is an updated test ticket.",
+                    ),
+                ),
+            ),
+            ("delete_ticket", ()),
+            ("create_message", (MessageCreate(content="This is a test message."),)),
+        ],
+    )
+    async def test_ticket_not_found(
+        self,
+        ticket_service: TicketService,
+        method: str,
+        args: tuple,
+    ):
+        with assert_http_error(status.HTTP_404_NOT_FOUND, "Ticket not found"):
+            await getattr(ticket_service, method)(uuid.uuid4(), *args)
 
     async def test_get_all_tickets(
         self,
@@ -223,9 +394,11 @@ class TestTicketService:
         assert isinstance(tickets, list)
         assert len(tickets) > 0
         assert all(isinstance(t, TicketRead) for t in tickets)
-        assert any(t.id == ticket.id for t in tickets)
-        assert any(t.title == ticket.title for t in tickets)
-        assert any(t.description == ticket.description for t in tickets)
+
+        tickets_by_id = {t.id: t for t in tickets}
+        assert ticket.id in tickets_by_id
+        assert tickets_by_id[ticket.id].title == ticket.title
+        assert tickets_by_id[ticket.id].description == ticket.description
 
     async def test_get_all_tickets_empty(
         self,
@@ -247,29 +420,115 @@ class TestTicketService:
         assert isinstance(tickets, list)
         assert len(tickets) > 0
         assert all(isinstance(t, TicketRead) for t in tickets)
-        assert any(t.id == ticket.id for t in tickets)
-        assert any(t.title == ticket.title for t in tickets)
-        assert any(t.description == ticket.description for t in tickets)
         assert all(t.user_id == user.id for t in tickets)
 
-    async def test_get_all_tickets_by_user_not_found(
+        tickets_by_id = {t.id: t for t in tickets}
+        assert ticket.id in tickets_by_id
+        assert tickets_by_id[ticket.id].title == ticket.title
+        assert tickets_by_id[ticket.id].description == ticket.description
+
+    async def test_get_all_tickets_by_user_cached(
         self,
         ticket_service: TicketService,
+        ticket_repository: TicketRepository,
+        ticket_status: TicketStatusRead,
+        user: UserRead,
     ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.get_all_tickets_by_user(uuid.uuid4())
+        assert await ticket_service.get_all_tickets_by_user(user.id) == []
+
+        await ticket_repository.create(
+            TicketCreate(title="Hidden", user_id=user.id, status_id=ticket_status.id)
+        )
+        assert await ticket_service.get_all_tickets_by_user(user.id) == []
+
+        ticket = await ticket_service.create_ticket(
+            TicketCreate(title="Test", user_id=user.id, status_id=ticket_status.id)
+        )
+        await ticket_service.commit()
+        tickets = await ticket_service.get_all_tickets_by_user(user.id)
+        assert len(tickets) == 2
+        assert any(t.id == ticket.id for t in tickets)
+
+    async def test_get_all_tickets_by_user_json(
+        self,
+        ticket_service: TicketService,
+        ticket: TicketRead,
+        user: UserRead,
+    ):
+        tickets_json = await ticket_service.get_all_tickets_by_user_json(user.id)
+        assert ticket_list_adapter.validate_json(tickets_json) == [ticket]
+
+        await ticket_service.delete_ticket(ticket.id)
+        await ticket_service.commit()
+        assert await ticket_service.get_all_tickets_by_user_json(user.id) == b"[]"
+
+    async def test_create_message_invalidates_ticket_list_cache(
+        self,
+        ticket_service: TicketService,
+        ticket: TicketRead,
+        user: UserRead,
+    ):
+        [cached_ticket] = await ticket_service.get_all_tickets_by_user(user.id)
+        assert cached_ticket.messages == []
+
+        message = await ticket_service.create_message(
+            ticket.id,
+            MessageCreate(content="Test message"),
+        )
+        await ticket_service.commit()
 
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
-        assert excinfo.value.detail == "User not found"
+        [cached_ticket] = await ticket_service.get_all_tickets_by_user(user.id)
+        assert cached_ticket.messages == [message]
 
-    async def test_get_all_tickets_by_user_not_uuid(
+    async def test_rollback_keeps_ticket_list_cache(
         self,
         ticket_service: TicketService,
+        ticket: TicketRead,
+        user: UserRead,
     ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.get_all_tickets_by_user("not-a-uuid")
+        user_id = user.id
+        await ticket_service.commit()
+        await ticket_service.get_all_tickets_by_user(user_id)
+
+        await ticket_service.delete_ticket(ticket.id)
+        await ticket_service.ticket_repository.session.rollback()
+        await ticket_service.commit()
 
-        assert excinfo.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert ticket_service.ticket_list_cache.get(user_id) is not None
+
+    async def test_ticket_list_invalidated_during_fill(
+        self,
+        ticket_service: TicketService,
+        ticket: TicketRead,
+        user: UserRead,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        get_all_by_user = ticket_service.ticket_repository.get_all_by_user
+
+        async def get_all_by_user_then_invalidate(user_id: uuid.UUID):
+            db_tickets = await get_all_by_user(user_id)
+            # Another request commits a change to the user's tickets while this read is in flight.
+            ticket_service.ticket_list_cache.delete(user_id)
+            return db_tickets
+
+        monkeypatch.setattr(
+            ticket_service.ticket_repository,
+            "get_all_by_user",
+            get_all_by_user_then_invalidate,
+        )
+        assert await ticket_service.get_all_tickets_by_user(user.id) == [ticket]
+        assert ticket_service.ticket_list_cache.get(user.id) is None
+
+        monkeypatch.undo()
+        assert await ticket_service.get_all_tickets_by_user(user.id) == [ticket]
+        assert ticket_service.ticket_list_cache.get(user.id) is not None
+
+    async def test_get_all_tickets_by_user_not_found(
+        self,
+        ticket_service: TicketService,
+    ):
+        with assert_http_error(status.HTTP_404_NOT_FOUND, "User not found"):
+            await ticket_service.get_all_tickets_by_user(uuid.uuid4())
 
     async def test_update_ticket(
         self,
@@ -308,32 +567,25 @@ class TestTicketService:
         assert updated_ticket.user_id == ticket.user_id
         assert updated_ticket.status_id == ticket.status_id
 
-    async def test_update_ticket_not_found(
+    async def test_update_ticket_empty(
         self,
         ticket_service: TicketService,
+        ticket: TicketRead,
     ):
-        ticket_update = TicketUpdate(
-            title="Updated Test Ticket",
-            description="This is an updated test ticket.",
-        )
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.update_ticket(uuid.uuid4(), ticket_update)
+        updated_ticket = await ticket_service.update_ticket(ticket.id, TicketUpdate())
+        assert updated_ticket == ticket
 
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
-        assert excinfo.value.detail == "Ticket not found"
+        with assert_http_error(status.HTTP_404_NOT_FOUND, "Ticket not found"):
+            await ticket_service.update_ticket(uuid.uuid4(), TicketUpdate())
 
-    async def test_update_ticket_not_uuid(
+    async def test_update_ticket_status_not_found(
         self,
         ticket_service: TicketService,
+        ticket: TicketRead,
     ):
-        ticket_update = TicketUpdate(
-            title="Updated Test Ticket",
-            description="This is an updated test ticket.",
-        )
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.update_ticket("not-a-uuid", ticket_update)
-
-        assert excinfo.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        ticket_update = TicketUpdate(status_id=uuid.uuid4())
+        with assert_http_error(status.HTTP_404_NOT_FOUND, "Ticket status not found"):
+            await ticket_service.update_ticket(ticket.id, ticket_update)
 
     async def test_delete_ticket(
         self,
@@ -341,32 +593,10 @@ class TestTicketService:
         ticket: TicketRead,
     ):
         await ticket_service.delete_ticket(ticket.id)
-        with pytest.raises(HTTPException) as excinfo:
+        with assert_http_error(status.HTTP_404_NOT_FOUND, "Ticket not found"):
             await ticket_service.get_ticket(ticket.id)
 
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
-        assert excinfo.value.detail == "Ticket not found"
-
-    async def test_delete_ticket_not_found(
-        self,
-        ticket_service: TicketService,
-    ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.delete_ticket(uuid.uuid4())
-
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
-        assert excinfo.value.detail == "Ticket not found"
-
-    async def test_delete_ticket_not_uuid(
-        self,
-        ticket_service: TicketService,
-    ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.delete_ticket("not-a-uuid")
-
-        assert excinfo.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    async def test_is_ticket_accessible(
+    async def test_check_ticket_access(
         self,
         ticket_service: TicketService,
         ticket: TicketRead,
@@ -375,13 +605,9 @@ class TestTicketService:
         assert ticket.user_id == user.id
         assert user.is_superuser is False
 
-        is_accessible = await ticket_service.is_ticket_accessible(
-            ticket.id,
-            user.id,
-        )
-        assert is_accessible is True
+        await ticket_service.check_ticket_access(ticket.id, user)
 
-    async def test_is_ticket_accessible_not_owner(
+    async def test_check_ticket_access_not_owner(
         self,
         ticket_service: TicketService,
         superuser_ticket: TicketRead,
@@ -390,15 +616,10 @@ class TestTicketService:
         assert superuser_ticket.user_id != user.id
         assert user.is_superuser is False
 
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.is_ticket_accessible(
-                superuser_ticket.id,
-                user.id,
-            )
+        with assert_http_error(status.HTTP_403_FORBIDDEN):
+            await ticket_service.check_ticket_access(superuser_ticket.id, user)
 
-        assert excinfo.value.status_code == status.HTTP_403_FORBIDDEN
-
-    async def test_is_ticket_accessible_superuser(
+    async def test_check_ticket_access_superuser(
         self,
         ticket_service: TicketService,
         ticket: TicketRead,
@@ -407,53 +628,42 @@ class TestTicketService:
         assert ticket.user_id != superuser.id
         assert superuser.is_superuser is True
 
-        is_accessible = await ticket_service.is_ticket_accessible(
-            ticket.id,
-            superuser.id,
-        )
-        assert is_accessible is True
+        await ticket_service.check_ticket_access(ticket.id, superuser)
 
-    async def test_is_ticket_accessible_ticket_not_found(
+    async def test_get_ticket_for_user(
         self,
         ticket_service: TicketService,
+        ticket: TicketRead,
         user: UserRead,
+        superuser: UserRead,
     ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.is_ticket_accessible(uuid.uuid4(), user.id)
-
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
-        assert excinfo.value.detail == "Ticket not found"
+        assert await ticket_service.get_ticket_for_user(ticket.id, user) == ticket
+        assert await ticket_service.get_ticket_for_user(ticket.id, superuser) == ticket
 
-    async def test_is_ticket_accessible_user_not_found(
+    async def test_get_ticket_for_user_not_owner(
         self,
         ticket_service: TicketService,
-        ticket: TicketRead,
+        superuser_ticket: TicketRead,
+        user: UserRead,
     ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.is_ticket_accessible(ticket.id, uuid.uuid4())
-
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
-        assert excinfo.value.detail == "User not found"
+        with assert_http_error(status.HTTP_403_FORBIDDEN):
+            await ticket_service.get_ticket_for_user(superuser_ticket.id, user)
 
-    async def test_is_ticket_accessible_ticket_not_uuid(
+    async def test_get_ticket_for_user_not_found(
         self,
         ticket_service: TicketService,
         user: UserRead,
     ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.is_ticket_accessible("not-a-uuid", user.id)
+        with assert_http_error(status.HTTP_404_NOT_FOUND):
+            await ticket_service.get_ticket_for_user(uuid.uuid4(), user)
 
-        assert excinfo.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    async def test_is_ticket_accessible_user_not_uuid(
+    async def test_check_ticket_access_ticket_not_found(
         self,
         ticket_service: TicketService,
-        ticket: TicketRead,
+        user: UserRead,
     ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.is_ticket_accessible(ticket.id, "not-a-uuid")
-
-        assert excinfo.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        with assert_http_error(status.HTTP_404_NOT_FOUND, "Ticket not found"):
+            await ticket_service.check_ticket_access(uuid.uuid4(), user)
 
     async def test_create_message(
         self,
@@ -475,147 +685,16 @@ class TestTicketService:
         assert message.created_at is not None
         assert message.is_ai is False
 
-    async def test_create_message_ticket_not_found(
-        self,
-        ticket_service: TicketService,
-    ):
-        message_create = MessageCreate(
-            content="This is a test message.",
-        )
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.create_message(uuid.uuid4(), message_create)
-
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
-        assert excinfo.value.detail == "Ticket not found"
-
-    async def test_create_message_ticket_not_uuid(
-        self,
-        ticket_service: TicketService,
-    ):
-        message_create = MessageCreate(
-            content="This is a test message.",
-        )
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.create_message("not-a-uuid", message_create)
-
-        assert excinfo.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    async def test_get_ticket_messages(
-        self,
-        ticket_service: TicketService,
-        ticket: TicketRead,
-        message: MessageRead,
-    ):
-        messages = await ticket_service.get_ticket_messages(ticket.id)
-        assert messages is not None
-        assert isinstance(messages, list)
-        assert len(messages) > 0
-        assert all(isinstance(m, MessageRead) for m in messages)
-        assert any(m.ticket_id == ticket.id for m in messages)
-        assert any(m.id == message.id for m in messages)
-        assert any(m.content == message.content for m in messages)
-        assert any(m.is_ai is message.is_ai for m in messages)
-
-        # Validate order of messages
-
-        assert messages == sorted(
-            messages,
-            key=lambda m: m.created_at,
-        )
-
-    async def test_get_ticket_messages_empty(
-        self,
-        ticket_service: TicketService,
-        ticket: TicketRead,
-    ):
-        messages = await ticket_service.get_ticket_messages(ticket.id)
-        assert messages is not None
-        assert isinstance(messages, list)
-        assert len(messages) == 0
-
-    async def test_get_ticket_messages_ticket_not_found(
-        self,
-        ticket_service: TicketService,
-    ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.get_ticket_messages(uuid.uuid4())
-
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
-        assert excinfo.value.detail == "Ticket not found"
-
-    async def test_get_ticket_messages_ticket_not_uuid(
-        self,
-        ticket_service: TicketService,
-    ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.get_ticket_messages("not-a-uuid")
-
-        assert excinfo.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-    async def test_get_last_customer_message(
-        self,
-        ticket_service: TicketService,
-        ticket: TicketRead,
-        message: MessageRead,
-    ):
-        last_message = await ticket_service.get_last_customer_message(ticket.id)
-        assert last_message is not None
-        assert isinstance(last_message, MessageRead)
-        assert last_message.id == message.id
-        assert last_message.content == message.content
-        assert last_message.ticket_id == ticket.id
-        assert last_message.is_ai is False
-
-    async def test_get_last_customer_message_no_messages(
-        self,
-        ticket_service: TicketService,
-        ticket: TicketRead,
-    ):
-        last_message = await ticket_service.get_last_customer_message(ticket.id)
-        assert last_message is None
-
-    async def test_get_last_customer_message_no_customer_messages(
-        self,
-        ticket_service: TicketService,
-        ticket: TicketRead,
-        ai_message: MessageRead,
-    ):
-        last_message = await ticket_service.get_last_customer_message(ticket.id)
-        assert last_message is None
-        assert ai_message.is_ai is True
-        assert ai_message.ticket_id == ticket.id
-
-    async def test_get_last_customer_message_both_messages(
+    async def test_get_ticket_messages_order(
         self,
         ticket_service: TicketService,
         ticket: TicketRead,
         message: MessageRead,
         ai_message: MessageRead,
     ):
-        last_message = await ticket_service.get_last_customer_message(ticket.id)
-        assert last_message is not None
-        assert isinstance(last_message, MessageRead)
-        assert last_message.id == message.id
-        assert last_message.content == message.content
-        assert last_message.ticket_id == ticket.id
-        assert last_message.is_ai is False
-        assert ai_message.is_ai is True
-
-    async def test_get_last_customer_message_ticket_not_found(
-        self,
-        ticket_service: TicketService,
-    ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.get_last_customer_message(uuid.uuid4())
-
-        assert excinfo.value.status_code == status.HTTP_404_NOT_FOUND
-        assert excinfo.value.detail == "Ticket not found"
-
-    async def test_get_last_customer_message_ticket_not_uuid(
-        self,
-        ticket_service: TicketService,
-    ):
-        with pytest.raises(HTTPException) as excinfo:
-            await ticket_service.get_last_customer_message("not-a-uuid")
-
-        assert excinfo.value.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        ticket_read = await ticket_service.get_ticket(ticket.id)
+        assert {m.id for m in ticket_read.messages} == {message.id, ai_message.id}
+        assert all(
+            a.created_at <= b.created_at
+            for a, b in itertools.pairwise(ticket_read.messages)
+        )